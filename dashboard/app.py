@@ -4,25 +4,32 @@ Streamlit Dashboard for Sovereign AI Gateway visualization.
 import streamlit as st
 import requests
 import json
-import time
 import os
-from datetime import datetime
-from typing import Dict, List
+import pandas as pd
+from bisect import bisect_right
+from typing import Dict, Iterator, List, Tuple
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Configuration
 GATEWAY_URL = os.getenv("GATEWAY_URL", "http://gateway_api:8000")
 AUDIT_API_URL = f"{GATEWAY_URL}/audit/recent"
+AUDIT_TABLE_LIMIT = 10  # Entries shown in the Recent Activity table
+AUDIT_SUMMARY_LIMIT = 200  # Window used for the route count metrics
 
-# Page configuration
-st.set_page_config(
-    page_title="Sovereign AI Gateway Dashboard",
-    page_icon="🛡️",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
+# Route indicator (emoji, label, CSS class) per gateway route
+_ROUTE_META = {
+    "cloud": ("☁️", "Cloud AI (OpenAI)", "route-cloud"),
+    "sovereign": ("🏠", "Sovereign LLM (Local)", "route-sovereign"),
+}
+_UNKNOWN_ROUTE_META = ("❓", "Unknown Route", "route-sovereign")
+
+# PII score CSS classes: below 0.3, from 0.3, and from 0.7
+_PII_SCORE_BOUNDS = (0.3, 0.7)
+_PII_SCORE_CLASSES = ("pii-score-low", "pii-score-medium", "pii-score-high")
 
-# Custom CSS for better styling
-st.markdown("""
+_CSS = """
     <style>
     .main-header {
         font-size: 2.5rem;
@@ -59,11 +66,63 @@ st.markdown("""
         font-weight: bold;
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """
+    Shared HTTP session for gateway calls.
 
+    Streamlit re-executes this script on every rerun, so the session is held
+    in the resource cache to keep pooled keep-alive connections alive across
+    reruns. Retries only apply to idempotent methods (urllib3 default), so
+    /gateway POSTs are never replayed.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.1,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False
+        )
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
-def call_gateway(prompt: str, user_id: str = None, session_id: str = None) -> Dict:
-    """Call the gateway API."""
+
+# Page configuration
+st.set_page_config(
+    page_title="Sovereign AI Gateway Dashboard",
+    page_icon="🛡️",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+_session = get_http_session()
+
+# Custom CSS for better styling. Streamlit drops elements a rerun does not
+# emit, so this is written on every full run (fragment reruns skip it).
+st.markdown(_CSS, unsafe_allow_html=True)
+
+
+def call_gateway_stream(prompt: str, user_id: str = None, session_id: str = None) -> Iterator[Dict]:
+    """
+    Call the streaming gateway API, yielding NDJSON events as they arrive.
+
+    Events are the routing metadata, then {"response": chunk} per chunk, then
+    {"done": True, "processing_time_ms": ...}. Failures yield {"error": ...}.
+    """
+    # Fail fast from the cached health check instead of waiting on a connect
+    health = check_gateway_health()
+    if health != "healthy":
+        yield {"error": f"Gateway {health}. Ensure the gateway is running, then retry."}
+        return
+    
     try:
         payload = {
             "prompt": prompt,
@@ -71,26 +130,34 @@ def call_gateway(prompt: str, user_id: str = None, session_id: str = None) -> Di
             "session_id": session_id
         }
         
-        response = requests.post(
-            f"{GATEWAY_URL}/gateway",
+        with _session.post(
+            f"{GATEWAY_URL}/gateway/stream",
             json=payload,
-            timeout=60
-        )
-        
-        if response.status_code == 200:
-            return response.json()
-        else:
-            return {"error": f"API Error: {response.status_code} - {response.text}"}
+            stream=True,
+            timeout=(1.0, 60.0)  # Short connect, long read for generation
+        ) as response:
+            if response.status_code != 200:
+                yield {"error": f"API Error: {response.status_code} - {response.text}"}
+                return
+            
+            for line in response.iter_lines():
+                if line:
+                    yield json.loads(line)
     except requests.exceptions.ConnectionError:
-        return {"error": "Cannot connect to Gateway API. Ensure the gateway is running."}
+        # The gateway went away since the last health check
+        check_gateway_health.clear()
+        yield {"error": "Cannot connect to Gateway API. Ensure the gateway is running."}
     except Exception as e:
-        return {"error": f"Request failed: {str(e)}"}
+        yield {"error": f"Request failed: {str(e)}"}
 
 
+# TTL matches the smallest auto-refresh interval, so timer ticks never see a
+# stale payload while reruns triggered by widget changes share one fetch.
+@st.cache_data(ttl=5, show_spinner=False)
 def get_audit_logs(limit: int = 50) -> List[Dict]:
     """Fetch recent audit logs."""
     try:
-        response = requests.get(AUDIT_API_URL, params={"limit": limit}, timeout=5)
+        response = _session.get(AUDIT_API_URL, params={"limit": limit}, timeout=5)
         if response.status_code == 200:
             return response.json().get("logs", [])
         return []
@@ -98,19 +165,94 @@ def get_audit_logs(limit: int = 50) -> List[Dict]:
         return []
 
 
+# Short timeouts and a cached result keep a slow or down gateway from adding
+# seconds to every rerun; the TTL lets recovery show up within 5 seconds.
+@st.cache_data(ttl=5, show_spinner=False)
+def check_gateway_health() -> str:
+    """Check gateway health: 'healthy', 'unhealthy' or 'unreachable'."""
+    try:
+        health_response = _session.get(f"{GATEWAY_URL}/health", timeout=(0.2, 0.5))
+        return "healthy" if health_response.status_code == 200 else "unhealthy"
+    except requests.exceptions.RequestException:
+        return "unreachable"
+
+
+def clear_gateway_caches():
+    """Drop cached health and audit results so the next run refetches them."""
+    check_gateway_health.clear()
+    get_audit_logs.clear()
+
+
 def get_pii_score_color(score: float) -> str:
     """Get color class based on PII score."""
-    if score >= 0.7:
-        return "pii-score-high"
-    elif score >= 0.3:
-        return "pii-score-medium"
-    else:
-        return "pii-score-low"
+    return _PII_SCORE_CLASSES[bisect_right(_PII_SCORE_BOUNDS, score)]
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def build_log_rows(count: int, newest_timestamp: str, _logs: List[Dict]) -> pd.DataFrame:
+    """
+    Build the audit table for the 10 most recent log entries.
+
+    Cached on the entry count and newest timestamp; ``_logs`` is excluded
+    from the cache key, so unchanged logs skip the formatting. Columns are
+    transformed with vectorized pandas operations rather than per row.
+    """
+    df = pd.DataFrame(_logs[:10]).reindex(
+        columns=["timestamp", "route", "pii_score", "model_used", "pii_types"]
+    )
+    
+    # Unparseable timestamps are shown as received
+    timestamps = pd.to_datetime(df["timestamp"], errors="coerce", utc=True, format="ISO8601")
+    
+    table = pd.DataFrame({
+        "Time": timestamps.dt.strftime("%Y-%m-%d %H:%M:%S").fillna(df["timestamp"]).fillna(""),
+        "Route": df["route"].fillna("unknown").str.upper(),
+        "PII Score": df["pii_score"].fillna(0).map("{:.2f}".format),
+        "Model": df["model_used"].fillna("unknown"),
+        "PII Types": df["pii_types"].map(
+            lambda types: ", ".join(types)[:30] if isinstance(types, list) else ""
+        ).replace("", "None")
+    })
+    return table
 
 
-def get_route_indicator_class(route: str) -> str:
-    """Get CSS class for route indicator."""
-    return "route-cloud" if route == "cloud" else "route-sovereign"
+def fetch_audit_panel_logs() -> Tuple[List[Dict], List[Dict]]:
+    """Fetch the summary window and the table rows as two bounded requests."""
+    return get_audit_logs(limit=AUDIT_SUMMARY_LIMIT), get_audit_logs(limit=AUDIT_TABLE_LIMIT)
+
+
+def render_audit_logs():
+    """Render the audit log panel (runs as a fragment so it can refresh on its own)."""
+    
+    # Fetch and display audit logs
+    summary_logs, logs = fetch_audit_panel_logs()
+    
+    if logs:
+        st.metric("Total Log Entries", len(summary_logs))
+        
+        # Summary statistics
+        cloud_count = sum(1 for log in summary_logs if log.get("route") == "cloud")
+        sovereign_count = sum(1 for log in summary_logs if log.get("route") == "sovereign")
+        
+        col_stat1, col_stat2 = st.columns(2)
+        with col_stat1:
+            st.metric("☁️ Cloud Routes", cloud_count)
+        with col_stat2:
+            st.metric("🏠 Sovereign Routes", sovereign_count)
+        
+        # Recent logs table
+        st.subheader("Recent Activity")
+        
+        # Prepare log data for display (rebuilt only when the log set changes)
+        log_table = build_log_rows(len(logs), logs[0].get("timestamp"), logs)
+        st.dataframe(log_table, use_container_width=True, hide_index=True)
+        
+        # Detailed log viewer
+        with st.expander("🔍 View Raw Logs"):
+            st.json(logs[:5])  # Show first 5 as JSON
+    
+    else:
+        st.info("No audit logs available. Send a request to generate logs.")
 
 
 def main():
@@ -126,22 +268,21 @@ def main():
         st.info("**Australian Data Sovereignty Enforcement**\n\nRoutes sensitive prompts to local LLMs, general prompts to cloud AI.")
         
         st.subheader("Gateway Status")
-        try:
-            health_response = requests.get(f"{GATEWAY_URL}/health", timeout=2)
-            if health_response.status_code == 200:
-                st.success("✅ Gateway Operational")
-            else:
-                st.error("❌ Gateway Unhealthy")
-        except:
+        health = check_gateway_health()
+        if health == "healthy":
+            st.success("✅ Gateway Operational")
+        elif health == "unhealthy":
+            st.error("❌ Gateway Unhealthy")
+        else:
             st.error("❌ Gateway Unreachable")
         
         st.subheader("Settings")
-        auto_refresh = st.checkbox("Auto-refresh logs", value=False)
-        refresh_interval = st.slider("Refresh interval (seconds)", 5, 60, 10)
+        st.checkbox("Auto-refresh logs", value=False, key="auto_refresh")
+        st.slider("Refresh interval (seconds)", 5, 60, 10, key="refresh_interval")
         
-        if auto_refresh:
-            time.sleep(refresh_interval)
-            st.rerun()
+        # Clearing in the callback runs before the rerun, so the status above
+        # is refreshed too
+        st.button("🔄 Refresh now", use_container_width=True, on_click=clear_gateway_caches)
     
     # Main content area
     col1, col2 = st.columns([1, 1])
@@ -153,7 +294,7 @@ def main():
         prompt = st.text_area(
             "Enter your prompt:",
             height=200,
-            placeholder="Type your prompt here...\n\nExample:\n'What is the capital of Australia?'\n\nOr sensitive:\n'My Medicare number is 1234 567 890'"
+            placeholder="Type your prompt here...\n\nExample:\n'What is the capital of Australia?'\n\nOr sensitive:\n'My Medicare number is 2123 456 701'"
         )
         
         col_submit1, col_submit2 = st.columns([1, 1])
@@ -167,15 +308,30 @@ def main():
         
         # Process request
         if submit_button and prompt:
+            result = {"response": ""}
+            placeholder = st.empty()
             with st.spinner("Processing through gateway..."):
-                result = call_gateway(prompt)
-                
-                if "error" in result:
-                    st.error(f"❌ {result['error']}")
-                else:
-                    # Store result in session state for display
-                    st.session_state.last_result = result
-                    st.rerun()
+                # Render output as it streams so the first tokens show up
+                # without waiting for the whole completion
+                for event in call_gateway_stream(prompt):
+                    if "error" in event:
+                        result = event
+                        break
+                    if "response" in event:
+                        result["response"] += event["response"]
+                        placeholder.markdown(result["response"])
+                    else:
+                        result.update(event)
+            
+            if "error" in result:
+                placeholder.empty()
+                st.error(f"❌ {result['error']}")
+            else:
+                # Store result in session state for display
+                st.session_state.last_result = result
+                # The request just added an audit entry
+                get_audit_logs.clear()
+                st.rerun()
         
         # Display last result
         if "last_result" in st.session_state and "error" not in st.session_state.last_result:
@@ -186,9 +342,7 @@ def main():
             
             # Route indicator
             route = result.get("route", "unknown")
-            route_class = get_route_indicator_class(route)
-            route_emoji = "☁️" if route == "cloud" else "🏠"
-            route_text = "Cloud AI (OpenAI)" if route == "cloud" else "Sovereign LLM (Local)"
+            route_emoji, route_text, route_class = _ROUTE_META.get(route, _UNKNOWN_ROUTE_META)
             
             st.markdown(
                 f'<div class="route-indicator {route_class}">{route_emoji} {route_text}</div>',
@@ -224,53 +378,10 @@ def main():
     with col2:
         st.header("📈 Audit Logs")
         
-        # Fetch and display audit logs
-        logs = get_audit_logs(limit=20)
-        
-        if logs:
-            st.metric("Total Log Entries", len(logs))
-            
-            # Summary statistics
-            cloud_count = sum(1 for log in logs if log.get("route") == "cloud")
-            sovereign_count = sum(1 for log in logs if log.get("route") == "sovereign")
-            
-            col_stat1, col_stat2 = st.columns(2)
-            with col_stat1:
-                st.metric("☁️ Cloud Routes", cloud_count)
-            with col_stat2:
-                st.metric("🏠 Sovereign Routes", sovereign_count)
-            
-            # Recent logs table
-            st.subheader("Recent Activity")
-            
-            # Prepare log data for display
-            log_data = []
-            for log in logs[:10]:  # Show last 10
-                timestamp = log.get("timestamp", "")
-                if timestamp:
-                    try:
-                        dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                        timestamp = dt.strftime("%Y-%m-%d %H:%M:%S")
-                    except:
-                        pass
-                
-                log_data.append({
-                    "Time": timestamp,
-                    "Route": log.get("route", "unknown").upper(),
-                    "PII Score": f"{log.get('pii_score', 0):.2f}",
-                    "Model": log.get("model_used", "unknown"),
-                    "PII Types": ", ".join(log.get("pii_types", []))[:30] or "None"
-                })
-            
-            if log_data:
-                st.dataframe(log_data, use_container_width=True, hide_index=True)
-            
-            # Detailed log viewer
-            with st.expander("🔍 View Raw Logs"):
-                st.json(logs[:5])  # Show first 5 as JSON
-        
-        else:
-            st.info("No audit logs available. Send a request to generate logs.")
+        # Only the audit panel re-executes on the refresh timer; the prompt
+        # form and last result keep their state between ticks.
+        run_every = st.session_state.refresh_interval if st.session_state.auto_refresh else None
+        st.fragment(run_every=run_every)(render_audit_logs)()
     
     # Footer
     st.markdown("---")
@@ -2,7 +2,6 @@
 Configuration management for the Sovereign AI Gateway.
 """
 
-import os
 from typing import List, Optional
 
 # Try pydantic_settings, fallback to BaseSettings for compatibility
@@ -103,46 +102,7 @@ class GatewayConfig(BaseSettings):
             case_sensitive = False
 
 
-# Global configuration instance
-# Load from environment variables
+# Global configuration instance.
+# BaseSettings reads environment variables (case-insensitively, taking
+# precedence over .env) and validates them, so no manual override is needed.
 config = GatewayConfig(_env_file=".env", _env_file_encoding="utf-8")
-
-# Override with environment variables if present
-for key in [
-    "OPENAI_API_KEY",
-    "OPENAI_BASE_URL",
-    "OPENAI_MODEL",
-    "OPENAI_TIMEOUT",
-    "OPENAI_MAX_TOKENS",
-    "OLLAMA_BASE_URL",
-    "OLLAMA_MODEL",
-    "OLLAMA_TIMEOUT",
-    "PII_THRESHOLD",
-    "GATEWAY_HOST",
-    "GATEWAY_PORT",
-    "GATEWAY_LOG_LEVEL",
-    "MAX_REQUEST_SIZE",
-    "ENABLE_CORS",
-    "CORS_ORIGINS",
-    "AUDIT_LOG_FILE",
-    "AUDIT_LOG_LEVEL",
-    "RATE_LIMIT_ENABLED",
-    "RATE_LIMIT_PER_MINUTE",
-]:
-    env_value = os.getenv(key)
-    if env_value is not None:
-        # Convert to appropriate type
-        attr_name = key.lower()
-        if (
-            key.endswith("_TIMEOUT")
-            or key.endswith("_PORT")
-            or key.endswith("_SIZE")
-            or key.endswith("_PER_MINUTE")
-        ):
-            setattr(config, attr_name, int(env_value))
-        elif key.endswith("_THRESHOLD"):
-            setattr(config, attr_name, float(env_value))
-        elif key in ["ENABLE_CORS", "RATE_LIMIT_ENABLED"]:
-            setattr(config, attr_name, env_value.lower() in ["true", "1", "yes"])
-        else:
-            setattr(config, attr_name, env_value)
@@ -6,20 +6,29 @@ which enforces Australian data sovereignty by routing sensitive prompts to local
 LLMs while allowing non-sensitive prompts to use cloud AI models.
 """
 
+import asyncio
+import hashlib
 import logging
+import threading
 import time
-from typing import Optional
-
-from fastapi import FastAPI, HTTPException, Request, status
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
+
+import orjson
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
 from pydantic import ValidationError
 
 from .config import config
 from .inspector import AustralianPIIInspector
 from .logging_utils import ComplianceLogger
-from .models import GatewayRequest, GatewayResponse
+from .models import GatewayRequest, GatewayResponse, PIIDetection
 from .router import LLMRouter
 
 # Configure logging
@@ -29,6 +38,41 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Run the batched audit writer while serving and release resources on shutdown.
+
+    On shutdown, entries still queued are written before the writer stops.
+    """
+    global _audit_queue
+
+    _audit_queue = asyncio.Queue(maxsize=AUDIT_QUEUE_MAX_ENTRIES)
+    flusher = asyncio.create_task(flush_audit_queue(_audit_queue, audit_logger))
+    yield
+
+    queue, _audit_queue = _audit_queue, None
+    await queue.put(None)
+    await flusher
+    await router.client.aclose()
+    router.session.close()
+
+
+class _GZipExceptPaths(GZipMiddleware):
+    """GZipMiddleware that passes the given paths through uncompressed."""
+
+    def __init__(self, app, exclude_paths: Tuple[str, ...] = (), **kwargs):
+        super().__init__(app, **kwargs)
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
 # Initialize FastAPI application
 app = FastAPI(
     title="Sovereign AI Gateway",
@@ -37,6 +81,8 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # CORS middleware configuration
@@ -50,11 +96,38 @@ if config.enable_cors:
         max_age=3600,
     )
 
+# Compress larger JSON bodies such as the /audit/recent log list. The NDJSON
+# stream is left out: the compressor would hold its small events back until
+# enough output had built up.
+app.add_middleware(
+    _GZipExceptPaths, exclude_paths=("/gateway/stream",), minimum_size=500, compresslevel=5
+)
+
 # Initialize services
 inspector = AustralianPIIInspector()
 router = LLMRouter()
 audit_logger = ComplianceLogger(log_file=config.audit_log_file)
 
+# detect_pii is a pure function of the prompt, so repeated prompts (retries,
+# smoke tests, probes) reuse earlier results. Entries are keyed by a digest,
+# expire after a TTL, and very long prompts are never cached. Detections are
+# frozen, so requests served from the cache can share them.
+PII_CACHE_MAX_ENTRIES = 10_000
+PII_CACHE_TTL_SECONDS = 300
+PII_CACHE_MAX_PROMPT_CHARS = 8192
+_pii_cache: "OrderedDict[bytes, Tuple[float, Tuple[PIIDetection, ...], float]]" = OrderedDict()
+_pii_cache_lock = threading.Lock()
+
+# Audit entries are queued by the request handlers and written in batches by
+# a single background task (see lifespan), so each request does not pay for
+# its own fsync. The queue is bounded; entries that do not fit
+# are dropped and counted rather than holding up requests.
+AUDIT_QUEUE_MAX_ENTRIES = 10_000
+AUDIT_BATCH_MAX_ENTRIES = 256
+AUDIT_BATCH_WAIT_SECONDS = 0.05
+_audit_queue: Optional["asyncio.Queue[Optional[dict]]"] = None
+_audit_dropped_entries = 0
+
 logger.info("Sovereign AI Gateway initialized")
 logger.info(f"PII Threshold: {config.pii_threshold}")
 logger.info(f"OpenAI Model: {config.openai_model}")
@@ -106,6 +179,144 @@ def get_client_ip(request: Request) -> Optional[str]:
     return None
 
 
+def validate_prompt(request: GatewayRequest) -> None:
+    """
+    Validate a gateway prompt before inspection.
+
+    Args:
+        request: Gateway request to validate
+
+    Raises:
+        HTTPException: If the prompt is empty or exceeds the size limit
+    """
+    if not request.prompt or not request.prompt.strip():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Prompt cannot be empty"
+        )
+
+    # Check request size. A character is at most 4 bytes in UTF-8, so the
+    # prompt only needs encoding when it could be over the limit.
+    max_size = config.max_request_size
+    if len(request.prompt) * 4 <= max_size:
+        return
+
+    prompt_size = len(request.prompt.encode("utf-8"))
+    if prompt_size > max_size:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=(f"Request size ({prompt_size} bytes) " f"exceeds maximum ({max_size} bytes)"),
+        )
+
+
+def inspect_prompt(prompt: str) -> Tuple[List[PIIDetection], float]:
+    """
+    Detect PII in a prompt, reusing recent results for identical prompts.
+
+    Args:
+        prompt: Prompt text to inspect
+
+    Returns:
+        Tuple of (list of PIIDetection objects, overall PII score 0.0-1.0)
+    """
+    if len(prompt) > PII_CACHE_MAX_PROMPT_CHARS:
+        return inspector.detect_pii(prompt)
+
+    key = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).digest()
+    now = time.monotonic()
+
+    with _pii_cache_lock:
+        cached = _pii_cache.get(key)
+        if cached is not None and now - cached[0] < PII_CACHE_TTL_SECONDS:
+            _pii_cache.move_to_end(key)
+            return list(cached[1]), cached[2]
+
+    pii_detections, pii_score = inspector.detect_pii(prompt)
+
+    with _pii_cache_lock:
+        _pii_cache[key] = (now, tuple(pii_detections), pii_score)
+        _pii_cache.move_to_end(key)
+        while len(_pii_cache) > PII_CACHE_MAX_ENTRIES:
+            _pii_cache.popitem(last=False)
+
+    return pii_detections, pii_score
+
+
+async def write_audit_entry(
+    request: GatewayRequest,
+    pii_detections: List[PIIDetection],
+    pii_score: float,
+    route: str,
+    model_used: str,
+    response_length: int,
+    processing_time: float,
+    client_ip: Optional[str],
+) -> None:
+    """Queue the compliance audit entry for a processed request."""
+    global _audit_dropped_entries
+
+    try:
+        entry = audit_logger.build_entry(
+            route=route,
+            pii_score=pii_score,
+            pii_types=[det.type for det in pii_detections],
+            model_used=model_used,
+            prompt_length=len(request.prompt),
+            response_length=response_length,
+            processing_time_ms=processing_time,
+            user_id=request.user_id,
+            session_id=request.session_id,
+            ip_address=client_ip,
+        )
+
+        if _audit_queue is None:
+            # No batch writer running (app served without its lifespan)
+            await run_in_threadpool(audit_logger.write_batch, [entry])
+            return
+
+        _audit_queue.put_nowait(entry)
+    except asyncio.QueueFull:
+        _audit_dropped_entries += 1
+        logger.warning(f"Audit queue full, dropped entry ({_audit_dropped_entries} total)")
+    except Exception as log_error:
+        logger.error(f"Failed to write audit log: {log_error}", exc_info=True)
+        # Don't fail the request if logging fails
+
+
+async def flush_audit_queue(
+    queue: "asyncio.Queue[Optional[dict]]", compliance_logger: ComplianceLogger
+) -> None:
+    """
+    Write queued audit entries in batches until a None sentinel is received.
+
+    After the first entry of a batch arrives, waits briefly so concurrent
+    requests can join it, then logs up to AUDIT_BATCH_MAX_ENTRIES entries
+    (to the audit file and the console) with a single fsync.
+
+    Args:
+        queue: Queue of entries built by ComplianceLogger.build_entry()
+        compliance_logger: Logger that writes the batches
+    """
+    stopping = False
+    while not stopping:
+        entry = await queue.get()
+        if entry is None:
+            return
+
+        await asyncio.sleep(AUDIT_BATCH_WAIT_SECONDS)
+        batch = [entry]
+        while len(batch) < AUDIT_BATCH_MAX_ENTRIES and not queue.empty():
+            entry = queue.get_nowait()
+            if entry is None:
+                stopping = True
+                break
+            batch.append(entry)
+
+        try:
+            await run_in_threadpool(compliance_logger.write_batch, batch)
+        except Exception as log_error:
+            logger.error(f"Failed to write {len(batch)} audit entries: {log_error}", exc_info=True)
+
+
 @app.get("/", tags=["Health"])
 async def root():
     """
@@ -139,6 +350,11 @@ async def health():
             "router": "operational",
             "audit_logger": "operational",
         },
+        "pii_engines": inspector.engines,
+        "audit_queue": {
+            "pending": _audit_queue.qsize() if _audit_queue is not None else 0,
+            "dropped": _audit_dropped_entries,
+        },
         "configuration": {
             "pii_threshold": config.pii_threshold,
             "openai_configured": bool(config.openai_api_key),
@@ -150,7 +366,9 @@ async def health():
 
 
 @app.post("/gateway", response_model=GatewayResponse, tags=["Gateway"])
-async def gateway_endpoint(request: GatewayRequest, http_request: Request):
+async def gateway_endpoint(
+    request: GatewayRequest, http_request: Request, background_tasks: BackgroundTasks
+):
     """
     Main gateway endpoint for AI inference requests.
 
@@ -163,6 +381,7 @@ async def gateway_endpoint(request: GatewayRequest, http_request: Request):
     Args:
         request: Gateway request containing prompt and optional metadata
         http_request: FastAPI request object for extracting client information
+        background_tasks: Tasks run after the response is sent (audit logging)
 
     Returns:
         GatewayResponse with AI response and routing metadata
@@ -173,33 +392,18 @@ async def gateway_endpoint(request: GatewayRequest, http_request: Request):
     client_ip = get_client_ip(http_request)
 
     try:
-        # Input validation
-        if not request.prompt or not request.prompt.strip():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST, detail="Prompt cannot be empty"
-            )
-
-        # Check request size
-        prompt_size = len(request.prompt.encode("utf-8"))
-        max_size = config.max_request_size
-        if prompt_size > max_size:
-            raise HTTPException(
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                detail=(
-                    f"Request size ({prompt_size} bytes) " f"exceeds maximum ({max_size} bytes)"
-                ),
-            )
+        validate_prompt(request)
 
         logger.info(f"Processing request from {client_ip}, prompt length: {len(request.prompt)}")
 
-        # Step 1: Inspect for PII
-        pii_detections, pii_score = inspector.detect_pii(request.prompt)
+        # Step 1: Inspect for PII (CPU-bound regex pass, kept off the event loop)
+        pii_detections, pii_score = await run_in_threadpool(inspect_prompt, request.prompt)
         pii_types = [det.type for det in pii_detections]
 
         logger.debug(f"PII detection complete: score={pii_score:.2f}, types={pii_types}")
 
         # Step 2: Route and get inference
-        response_text, route, processing_time = router.route_and_infer(
+        response_text, route, processing_time = await router.route_and_infer_async(
             prompt=request.prompt, pii_detections=pii_detections, pii_score=pii_score
         )
 
@@ -210,23 +414,18 @@ async def gateway_endpoint(request: GatewayRequest, http_request: Request):
             f"Request processed: route={route}, model={model_used}, time={processing_time:.1f}ms"
         )
 
-        # Step 4: Log for compliance
-        try:
-            audit_logger.log_request(
-                route=route,
-                pii_score=pii_score,
-                pii_types=pii_types,
-                model_used=model_used,
-                prompt_length=len(request.prompt),
-                response_length=len(response_text),
-                processing_time_ms=processing_time,
-                user_id=request.user_id,
-                session_id=request.session_id,
-                ip_address=client_ip,
-            )
-        except Exception as log_error:
-            logger.error(f"Failed to write audit log: {log_error}", exc_info=True)
-            # Don't fail the request if logging fails
+        # Step 4: Log for compliance once the response has been sent
+        background_tasks.add_task(
+            write_audit_entry,
+            request,
+            pii_detections,
+            pii_score,
+            route,
+            model_used,
+            len(response_text),
+            processing_time,
+            client_ip,
+        )
 
         # Step 5: Return response
         return GatewayResponse(
@@ -254,28 +453,153 @@ async def gateway_endpoint(request: GatewayRequest, http_request: Request):
         )
 
 
+@app.post("/gateway/stream", tags=["Gateway"])
+async def gateway_stream_endpoint(
+    request: GatewayRequest, http_request: Request, background_tasks: BackgroundTasks
+):
+    """
+    Streaming variant of the gateway endpoint.
+
+    Inspection and routing are identical to POST /gateway, but the response
+    is newline-delimited JSON so clients can render output as it arrives:
+    1. {"route", "pii_score", "pii_detected", "model_used"} once routed
+    2. {"response": "<text chunk>"} for each chunk from the model
+    3. {"done": true, "processing_time_ms": ...} after the last chunk
+
+    The audit entry is written once the stream completes (or the client
+    disconnects).
+
+    Args:
+        request: Gateway request containing prompt and optional metadata
+        http_request: FastAPI request object for extracting client information
+        background_tasks: Tasks run after the response is sent (audit logging)
+
+    Returns:
+        StreamingResponse with application/x-ndjson content
+
+    Raises:
+        HTTPException: If the request is invalid or inspection fails
+    """
+    client_ip = get_client_ip(http_request)
+    validate_prompt(request)
+
+    try:
+        pii_detections, pii_score = await run_in_threadpool(inspect_prompt, request.prompt)
+    except Exception as e:
+        logger.error(f"Gateway processing error: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Gateway processing error. Please check logs for details.",
+        )
+
+    route = router.choose_route(pii_detections, pii_score)
+    model_used = router.get_model_name(route)
+
+    logger.info(f"Streaming request from {client_ip}: route={route}, model={model_used}")
+
+    stats = {"response_length": 0, "processing_time": 0.0}
+
+    async def events() -> AsyncIterator[bytes]:
+        start_time = time.perf_counter_ns()
+        header = {
+            "route": route,
+            "pii_score": pii_score,
+            # orjson serializes the PIIDetection dataclasses directly
+            "pii_detected": pii_detections,
+            "model_used": model_used,
+        }
+        yield orjson.dumps(header) + b"\n"
+
+        try:
+            async for chunk in router.stream_infer(request.prompt, route):
+                stats["response_length"] += len(chunk)
+                yield orjson.dumps({"response": chunk}) + b"\n"
+        finally:
+            stats["processing_time"] = (time.perf_counter_ns() - start_time) / 1e6
+
+        yield orjson.dumps({"done": True, "processing_time_ms": stats["processing_time"]}) + b"\n"
+
+    async def write_stream_audit_entry() -> None:
+        await write_audit_entry(
+            request,
+            pii_detections,
+            pii_score,
+            route,
+            model_used,
+            stats["response_length"],
+            stats["processing_time"],
+            client_ip,
+        )
+
+    # Stream length and timing are only known once the body has been sent
+    background_tasks.add_task(write_stream_audit_entry)
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
 @app.get("/audit/recent", tags=["Audit"])
-async def get_recent_audit_logs(limit: int = 50):
+async def get_recent_audit_logs(
+    limit: int = 50,
+    before: Optional[datetime] = None,
+    after: Optional[datetime] = None,
+    route: Optional[str] = None,
+    before_offset: Optional[int] = None,
+):
     """
     Get recent audit log entries for dashboard visualization.
 
     Args:
         limit: Maximum number of log entries to return (default: 50, max: 1000)
+        before: Only return entries logged before this ISO 8601 time
+        after: Only return entries logged after this ISO 8601 time
+        route: Only return entries for this route ("cloud" or "sovereign")
+        before_offset: Makes ``before`` inclusive, skipping this many entries
+            logged exactly at ``before`` (already returned on earlier pages)
 
     Returns:
-        Dictionary containing log entries and count
+        Dictionary containing log entries, count, and the ``before`` /
+        ``before_offset`` cursor for the next (older) page, or None when there
+        are no more entries
 
     Raises:
-        HTTPException: If limit is invalid
+        HTTPException: If limit, route or before_offset is invalid
     """
     if limit < 1 or limit > 1000:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Limit must be between 1 and 1000"
         )
+    if route is not None and route not in ("cloud", "sovereign"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Route must be cloud or sovereign"
+        )
+    if before_offset is not None and before_offset < 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="before_offset must not be negative"
+        )
 
     try:
-        logs = audit_logger.get_recent_logs(limit=limit)
-        return {"logs": logs, "count": len(logs), "limit": limit}
+        # The reverse file scan and queue flush block, so keep them off the event loop
+        logs = await run_in_threadpool(
+            audit_logger.get_recent_logs,
+            limit=limit,
+            before=before,
+            after=after,
+            route=route,
+            before_offset=before_offset,
+        )
+        next_before, next_before_offset = _next_audit_page_cursor(
+            logs, limit, before, before_offset
+        )
+        # Plain dicts skip FastAPI's jsonable_encoder pass when returned directly
+        return ORJSONResponse(
+            {
+                "logs": logs,
+                "count": len(logs),
+                "limit": limit,
+                "next_before": next_before,
+                "next_before_offset": next_before_offset,
+            }
+        )
     except Exception as e:
         logger.error(f"Error retrieving audit logs: {e}", exc_info=True)
         raise HTTPException(
@@ -284,6 +608,30 @@ async def get_recent_audit_logs(limit: int = 50):
         )
 
 
+def _next_audit_page_cursor(
+    logs: List[dict], limit: int, before: Optional[datetime], before_offset: Optional[int]
+) -> Tuple[Optional[str], Optional[int]]:
+    """
+    Build the (before, before_offset) cursor for the page after logs.
+
+    Several entries can share the oldest timestamp on a page, so the cursor
+    is inclusive and counts the entries at that timestamp already returned;
+    otherwise those left for the next page would be skipped.
+
+    Returns:
+        Cursor for the next page, or (None, None) when there are no more entries
+    """
+    if len(logs) < limit:
+        return None, None
+
+    next_before = logs[-1]["timestamp"]
+    next_before_offset = sum(1 for log in logs if log["timestamp"] == next_before)
+    # A page made up entirely of entries at the current cursor moves it forward
+    if before_offset and before is not None and datetime.fromisoformat(next_before) == before:
+        next_before_offset += before_offset
+    return next_before, next_before_offset
+
+
 if __name__ == "__main__":
     import uvicorn
 
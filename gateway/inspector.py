@@ -2,11 +2,231 @@
 PII Inspector for Australian identifiers and sensitive data detection.
 """
 
+import functools
+import itertools
+import logging
+import operator
 import re
-from typing import Dict, List, Tuple
+import threading
+import unicodedata
+from typing import Dict, List, Optional, Tuple
 
 from .models import PIIDetection
 
+# Hyperscan is optional: when installed, one pass over the text checks whether
+# any pattern can match before the re pass that extracts matches
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# pyahocorasick is optional: when installed, all sensitive keywords are found
+# in one pass over the text instead of one substring search per keyword
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# google-re2 is optional: when installed (and Hyperscan is not), a linear-time
+# RE2 search decides whether the backtracking re pass is needed. re still
+# extracts the matches, which is faster through its Python API when there are
+# many of them.
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+logger = logging.getLogger(__name__)
+
+# Every identifier pattern needs a digit or an "@" (email) to match, so text
+# without either can skip the pattern pass entirely. \d also covers non-ASCII
+# digits, matching what the patterns themselves accept.
+_PATTERN_HINT = re.compile(r"[\d@]")
+
+# Shortest text any identifier pattern can match (a BSB written as 5 digits)
+_MIN_PATTERN_LENGTH = 5
+
+# ASCII characters re's \s matches but a prefilter's may not: RE2 leaves out
+# \v and Hyperscan the information separators \x1c-\x1f (str.isspace accepts
+# both). Text containing one skips the prefilter.
+_PREFILTER_UNSAFE_WHITESPACE = re.compile(r"[\x0b\x1c-\x1f]")
+
+# Keyword score reaches its 0.6 cap at this many distinct keywords (0.15 each)
+_KEYWORD_SCORE_CAP_MATCHES = 4
+
+# Confidence per PII type; Medicare numbers and TFNs are only reported once
+# their checksum validates
+_TYPE_CONFIDENCE = {
+    "medicare": 0.95,
+    "tfn": 0.95,
+    "drivers_licence": 0.85,
+    "mobile": 0.80,
+    "credit_card": 0.90,
+}
+
+# Checksum weights: Medicare (first 8 digits) and TFN (by number length)
+_MEDICARE_WEIGHTS = (1, 3, 7, 9, 1, 3, 7, 9)
+_TFN_WEIGHTS = {8: (10, 7, 8, 4, 6, 3, 5, 1), 9: (1, 4, 3, 7, 5, 8, 6, 9, 10)}
+
+# Deletes the whitespace (re's \s, i.e. str.isspace) the Medicare/TFN patterns
+# allow between digit groups; U+3000 is the highest whitespace code point
+_WS_STRIP = str.maketrans("", "", "".join(c for c in map(chr, range(0x3001)) if c.isspace()))
+
+# Maps ASCII digit bytes to their values, so checksums work on the encoded
+# number without an int() call per digit
+_DIGIT_VALUES = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+
+def _ascii_digits(number: str) -> Optional[str]:
+    """
+    Strip the whitespace from a matched number and map its digits to ASCII.
+
+    re's \\d also matches other Unicode decimal digits (e.g. full-width
+    "１２３"), which are converted so the checksums still apply.
+
+    Returns:
+        ASCII digit string, or None if a character is not a decimal digit
+    """
+    digits = number.translate(_WS_STRIP)
+    if digits.isascii():
+        return digits if digits.isdigit() else None
+    try:
+        return "".join(str(unicodedata.decimal(char)) for char in digits)
+    except ValueError:
+        return None
+
+
+def _weighted_digit_sum(digits: str, weights: Tuple[int, ...]) -> Optional[int]:
+    """Return the weighted sum of an ASCII digit string, or None if it has other characters."""
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+    values = digits.encode("ascii").translate(_DIGIT_VALUES)
+    return sum(map(operator.mul, values, weights))
+
+
+# Identifier patterns in priority order: where several could match at the same
+# position, the combined pattern reports the first one listed. Compiled once at
+# import and shared by every inspector.
+_PATTERNS: Dict[str, re.Pattern] = {
+    # Driver's Licence: Various formats by state
+    # NSW: 8 digits or 1 letter + 7 digits
+    # VIC: 8 digits
+    # QLD: 1 letter + 8 digits
+    # WA: 1 letter + 7 digits
+    # SA: 1 letter + 8 digits
+    # TAS: 1 letter + 6 digits
+    # ACT: 1 letter + 8 digits
+    # NT: 1 letter + 7 digits
+    "drivers_licence": re.compile(
+        r"\b(?:DL|LIC|LICENCE|LICENSE)[\s:]*(?:[A-Z]\d{6,8}|\d{8})\b", re.IGNORECASE
+    ),
+    # Bank Account: 6-10 digits
+    "bank_account": re.compile(r"\b(?:account|acc)[\s:]*\d{6,10}\b", re.IGNORECASE),
+    # Email addresses
+    "email": re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"),
+    # Credit Card: 13-19 digits (basic pattern)
+    "credit_card": re.compile(r"\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b"),
+    # Australian Mobile: 04XX XXX XXX or 04XXXXXXXX (before Medicare,
+    # which also matches ten digits)
+    "mobile": re.compile(r"\b04\d{2}[\s-]?\d{3}[\s-]?\d{3}\b"),
+    # Medicare Number: 10 digits, format: XXXX XXX XXX or XXXXXXXXXX,
+    # checksum validated
+    "medicare": re.compile(r"\b\d{4}\s?\d{3}\s?\d{3}\b|\b\d{10}\b", re.IGNORECASE),
+    # Tax File Number: 8-9 digits, checksum validated
+    "tfn": re.compile(r"\b\d{8,9}\b", re.IGNORECASE),
+    # BSB: 6 digits (XX-XXX format)
+    "bsb": re.compile(r"\b\d{2}[\s-]?\d{3}\b"),
+    # Australian Postcode: 4 digits after "postcode" or a state abbreviation
+    # (a bare 4-digit run is more often a year, time or amount). Only
+    # "postcode" ignores case: lowercase "act", "nt" or "wa" before a number
+    # is ordinary text ("the Privacy Act 1988"), not an address.
+    "postcode": re.compile(
+        r"\b(?:(?i:post\s?code|postal\s+code)|NSW|VIC|QLD|SA|WA|TAS|NT|ACT)[\s:]*\d{4}\b"
+    ),
+}
+
+
+def _combine_patterns(patterns: Dict[str, re.Pattern], exclude: Tuple[str, ...] = ()) -> re.Pattern:
+    """
+    Combine identifier patterns into one alternation of named groups.
+
+    One finditer pass over the text then replaces a pass per pattern; the
+    group name of each match gives its PII type.
+
+    Args:
+        patterns: Compiled patterns by PII type, in priority order
+        exclude: PII types to leave out of the alternation
+    """
+    alternatives = []
+    for pii_type, pattern in patterns.items():
+        if pii_type in exclude:
+            continue
+        source = pattern.pattern
+        if pattern.flags & re.IGNORECASE:
+            source = f"(?i:{source})"
+        alternatives.append(f"(?P<{pii_type}>{source})")
+    return re.compile("|".join(alternatives))
+
+
+_COMBINED_PATTERN = _combine_patterns(_PATTERNS)
+
+# Literal every match of these types contains. A prompt without the literal
+# can leave that alternative out of the re pass; most prompts have neither.
+_PATTERN_ANCHORS = {"email": "@", "mobile": "04"}
+
+# Combined pattern for every set of types left out, keyed in _PATTERN_ANCHORS order
+_COMBINED_PATTERNS_EXCLUDING = {
+    excluded: _combine_patterns(_PATTERNS, exclude=excluded)
+    for size in range(len(_PATTERN_ANCHORS) + 1)
+    for excluded in itertools.combinations(_PATTERN_ANCHORS, size)
+}
+
+# Lowercase context keywords; each distinct one found adds to the keyword score
+_SENSITIVE_KEYWORDS = (
+    "medicare",
+    "tfn",
+    "tax file",
+    "driver licence",
+    "drivers license",
+    "passport",
+    "credit card",
+    "bank account",
+    "bsb",
+    "account number",
+    "diagnosis",
+    "patient",
+    "medical record",
+    "prescription",
+    "medication",
+    "legal advice",
+    "court case",
+    "criminal",
+    "conviction",
+    "salary",
+    "income",
+    "superannuation",
+    "super",
+    "pension",
+    "australian security",
+    "classified",
+    "confidential",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_keyword_automaton(keywords: Tuple[str, ...]) -> "ahocorasick.Automaton":
+    """
+    Build an Aho-Corasick automaton over the sensitive keywords.
+
+    Cached per keyword tuple, so inspectors share one automaton; it is only
+    read after construction.
+    """
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
 
 class AustralianPIIInspector:
     """
@@ -22,101 +242,133 @@ class AustralianPIIInspector:
     """
 
     def __init__(self):
-        self.patterns = self._compile_patterns()
-        self.sensitive_keywords = [
-            "medicare",
-            "tfn",
-            "tax file",
-            "driver licence",
-            "drivers license",
-            "passport",
-            "credit card",
-            "bank account",
-            "bsb",
-            "account number",
-            "diagnosis",
-            "patient",
-            "medical record",
-            "prescription",
-            "medication",
-            "legal advice",
-            "court case",
-            "criminal",
-            "conviction",
-            "salary",
-            "income",
-            "superannuation",
-            "super",
-            "pension",
-            "australian security",
-            "classified",
-            "confidential",
-        ]
+        self.patterns = _PATTERNS
+        self.combined_pattern = _COMBINED_PATTERN
+        # One bit per PII type, so the types seen in a prompt fit in one int
+        self._type_bits = {pii_type: 1 << index for index, pii_type in enumerate(self.patterns)}
+        self._re2_pattern = self._compile_re2()
+        self._validators = {"medicare": self._validate_medicare, "tfn": self._validate_tfn}
+        self._prefilter = self._compile_prefilter()
+        self._scratch = threading.local()
+        self.sensitive_keywords = _SENSITIVE_KEYWORDS
+        self._keyword_automaton = (
+            _build_keyword_automaton(self.sensitive_keywords) if ahocorasick is not None else None
+        )
+
+    def _compile_re2(self) -> Optional["re2._Regexp"]:
+        """Compile the combined pattern with RE2, if google-re2 is installed."""
+        if re2 is None:
+            return None
 
-    def _compile_patterns(self) -> Dict[str, re.Pattern]:
-        """Compile regex patterns for Australian identifiers."""
+        try:
+            return re2.compile(self.combined_pattern.pattern)
+        except re2.error as e:
+            logger.warning(f"RE2 unavailable for PII patterns, using re: {e}")
+            return None
+
+    def _compile_prefilter(self) -> Optional["hyperscan.Database"]:
+        """
+        Compile all patterns into one Hyperscan database, if Hyperscan is installed.
+
+        Each pattern reports at most one match, since the database is only used
+        to decide whether the re pass is needed at all.
+
+        Returns:
+            Compiled database, or None to always run the re pass
+        """
+        if hyperscan is None:
+            return None
+
+        flags = [
+            hyperscan.HS_FLAG_SINGLEMATCH
+            | (hyperscan.HS_FLAG_CASELESS if pattern.flags & re.IGNORECASE else 0)
+            for pattern in self.patterns.values()
+        ]
+        database = hyperscan.Database()
+        try:
+            database.compile(
+                expressions=[pattern.pattern.encode() for pattern in self.patterns.values()],
+                ids=list(range(len(self.patterns))),
+                elements=len(self.patterns),
+                flags=flags,
+            )
+        except hyperscan.error as e:
+            logger.warning(f"Hyperscan prefilter unavailable, using re only: {e}")
+            return None
+        return database
+
+    @property
+    def engines(self) -> Dict[str, str]:
+        """Name the matching engines in use, which depend on the optional packages installed."""
+        if self._prefilter is not None:
+            prefilter = "hyperscan"
+        elif self._re2_pattern is not None:
+            prefilter = "re2"
+        else:
+            prefilter = "none"
         return {
-            # Medicare Number: 10 digits, format: XXXX XXXX XX or XXXXXXXXXX
-            "medicare": re.compile(r"\b\d{4}\s?\d{3}\s?\d{3}\b|\b\d{10}\b", re.IGNORECASE),
-            # Tax File Number: 8-9 digits (with optional spaces)
-            "tfn": re.compile(r"\b\d{8,9}\b", re.IGNORECASE),
-            # Driver's Licence: Various formats by state
-            # NSW: 8 digits or 1 letter + 7 digits
-            # VIC: 8 digits
-            # QLD: 1 letter + 8 digits
-            # WA: 1 letter + 7 digits
-            # SA: 1 letter + 8 digits
-            # TAS: 1 letter + 6 digits
-            # ACT: 1 letter + 8 digits
-            # NT: 1 letter + 7 digits
-            "drivers_licence": re.compile(
-                r"\b(?:DL|LIC|LICENCE|LICENSE)[\s:]*([A-Z]\d{6,8}|\d{8})\b", re.IGNORECASE
-            ),
-            # Australian Mobile: 04XX XXX XXX or 04XXXXXXXX
-            "mobile": re.compile(r"\b04\d{2}[\s-]?\d{3}[\s-]?\d{3}\b"),
-            # Australian Postcode: 4 digits (0000-9999)
-            "postcode": re.compile(r"\b\d{4}\b"),
-            # Email addresses
-            "email": re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"),
-            # Credit Card: 13-19 digits (basic pattern)
-            "credit_card": re.compile(r"\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b"),
-            # BSB: 6 digits (XX-XXX format)
-            "bsb": re.compile(r"\b\d{2}[\s-]?\d{3}\b"),
-            # Bank Account: 6-10 digits
-            "bank_account": re.compile(r"\b(?:account|acc)[\s:]*\d{6,10}\b", re.IGNORECASE),
+            "prefilter": prefilter,
+            "patterns": "re",
+            "keywords": "aho-corasick" if self._keyword_automaton is not None else "substring",
         }
 
+    def _may_contain_pii(self, text: str) -> bool:
+        """
+        Check whether any pattern can match text, using an optional engine if available.
+
+        Hyperscan and RE2 give ASCII meanings to \\d, \\s and \\b, which differ
+        from re's Unicode-aware classes outside ASCII, and their \\s also leaves
+        out some ASCII separators re accepts; such text goes straight to the re
+        pass.
+        """
+        if not text.isascii() or _PREFILTER_UNSAFE_WHITESPACE.search(text):
+            return True
+        if self._prefilter is not None:
+            return self._hyperscan_matches(text)
+        if self._re2_pattern is not None:
+            return self._re2_pattern.search(text) is not None
+        return True
+
+    def _hyperscan_matches(self, text: str) -> bool:
+        """Scan ASCII text with the Hyperscan database, stopping at the first match."""
+        # Scratch space is per thread; the gateway inspects from a thread pool
+        scratch = getattr(self._scratch, "scratch", None)
+        if scratch is None:
+            scratch = self._scratch.scratch = hyperscan.Scratch(self._prefilter)
+
+        try:
+            # Returning True from the handler stops the scan at the first match
+            self._prefilter.scan(
+                text.encode("ascii"), match_event_handler=lambda *_: True, scratch=scratch
+            )
+        except hyperscan.ScanTerminated:
+            return True
+        return False
+
     def _validate_medicare(self, number: str) -> bool:
         """Validate Medicare number using checksum algorithm."""
-        digits = re.sub(r"\s", "", number)
-        if len(digits) != 10:
+        digits = _ascii_digits(number)
+        if digits is None:
+            return True  # Cannot be checksummed; report it unvalidated rather than drop it
+        if len(digits) != 10 or digits[0] not in "23456":
             return False
 
-        try:
-            # Medicare checksum validation
-            # Note: Real Medicare validation uses a more complex algorithm
-            # For demo purposes, we validate format but allow all checksums
-            # Format validation only - checksum validation relaxed for demo
-            # In production: validate checksum with calculated_check == int(digits[8:])
-            return True  # Format is valid, checksum validation relaxed for demo
-        except (ValueError, IndexError, TypeError):
-            return False
+        # The 9th digit is the weighted sum of the first 8 digits mod 10
+        total = _weighted_digit_sum(digits, _MEDICARE_WEIGHTS)
+        return total is not None and total % 10 == ord(digits[8]) - 48
 
     def _validate_tfn(self, number: str) -> bool:
         """Validate TFN using checksum algorithm."""
-        digits = re.sub(r"\s", "", number)
-        if len(digits) not in [8, 9]:
+        digits = _ascii_digits(number)
+        if digits is None:
+            return True  # Cannot be checksummed; report it unvalidated rather than drop it
+        weights = _TFN_WEIGHTS.get(len(digits))
+        if weights is None:
             return False
 
-        try:
-            # TFN checksum validation (weighted sum)
-            # Note: Real TFN validation uses weighted sum algorithm
-            # For demo purposes, we validate format but allow all checksums
-            # Format validation only - checksum validation relaxed for demo
-            # In production: validate checksum with (total % 11) == int(digits[-1])
-            return True  # Format is valid, checksum validation relaxed for demo
-        except (ValueError, IndexError, TypeError):
-            return False
+        # The weighted sum of all digits is divisible by 11
+        total = _weighted_digit_sum(digits, weights)
+        return total is not None and total % 11 == 0
 
     def detect_pii(self, text: str) -> Tuple[List[PIIDetection], float]:
         """
@@ -134,7 +386,8 @@ class AustralianPIIInspector:
         if not isinstance(text, str):
             raise TypeError(f"Expected string, got {type(text).__name__}")
 
-        if not text:
+        # Whitespace can hold neither a keyword nor an identifier
+        if not text or text.isspace():
             return [], 0.0
 
         text_lower = text.lower()
@@ -143,65 +396,100 @@ class AustralianPIIInspector:
         keyword_score = self._calculate_keyword_score(text_lower)
 
         # Pattern-based detection
-        detections = self._detect_patterns(text)
+        detections, type_mask = self._detect_patterns(text)
 
         # Calculate overall PII score
-        pii_score = self._calculate_pii_score(keyword_score, detections)
+        pii_score = self._calculate_pii_score(keyword_score, detections, type_mask)
 
         return detections, pii_score
 
     def _calculate_keyword_score(self, text_lower: str) -> float:
         """Calculate PII score from sensitive keywords."""
-        keyword_matches = sum(1 for keyword in self.sensitive_keywords if keyword in text_lower)
+        keyword_matches = self._count_keywords(text_lower)
         return min(keyword_matches * 0.15, 0.6)  # Max 0.6 from keywords
 
-    def _detect_patterns(self, text: str) -> List[PIIDetection]:
-        """Detect PII patterns in text (extracted for complexity reduction)."""
-        detections = []
+    def _count_keywords(self, text_lower: str) -> int:
+        """Count distinct sensitive keywords in text, stopping once the score is capped."""
+        if self._keyword_automaton is not None:
+            found = set()
+            for _, keyword in self._keyword_automaton.iter(text_lower):
+                found.add(keyword)
+                if len(found) >= _KEYWORD_SCORE_CAP_MATCHES:
+                    break
+            return len(found)
+
+        matches = 0
+        for keyword in self.sensitive_keywords:
+            if keyword in text_lower:
+                matches += 1
+                if matches >= _KEYWORD_SCORE_CAP_MATCHES:
+                    break
+        return matches
+
+    def _detect_patterns(self, text: str) -> Tuple[List[PIIDetection], int]:
+        """
+        Detect PII patterns in text (extracted for complexity reduction).
 
-        for pii_type, pattern in self.patterns.items():
-            matches = pattern.finditer(text)
-            for match in matches:
-                value = match.group(0)
-                confidence = self._get_confidence(pii_type, value)
-
-                detections.append(
-                    PIIDetection(
-                        type=pii_type,
-                        value=self._redact_value(value, pii_type),
-                        confidence=confidence,
-                        position=(match.start(), match.end()),
-                    )
+        Returns:
+            Tuple of (list of PIIDetection objects, bitmask of the PII types found)
+        """
+        if len(text) < _MIN_PATTERN_LENGTH or not _PATTERN_HINT.search(text):
+            return [], 0
+
+        if not self._may_contain_pii(text):
+            return [], 0
+
+        excluded = tuple(
+            pii_type for pii_type, anchor in _PATTERN_ANCHORS.items() if anchor not in text
+        )
+        pattern = _COMBINED_PATTERNS_EXCLUDING[excluded]
+
+        raw = []
+        type_mask = 0
+        for match in pattern.finditer(text):
+            pii_type = match.lastgroup
+            value = match.group(0)
+
+            # Skip digit runs that only match the format (failed checksum)
+            validator = self._validators.get(pii_type)
+            if validator is not None and not validator(value):
+                continue
+
+            raw.append((pii_type, value, match.span()))
+            type_mask |= self._type_bits[pii_type]
+
+        # Repeated values in one prompt are redacted once. The cache lives only
+        # for this call so raw identifiers are not kept in memory afterwards.
+        redacted: Dict[Tuple[str, str], str] = {}
+        detections = []
+        for pii_type, value, position in raw:
+            key = (value, pii_type)
+            if key not in redacted:
+                redacted[key] = self._redact_value(value, pii_type)
+            detections.append(
+                PIIDetection(
+                    type=pii_type,
+                    value=redacted[key],
+                    confidence=self._get_confidence(pii_type),
+                    position=position,
                 )
+            )
+        return detections, type_mask
 
-        return detections
-
-    def _get_confidence(self, pii_type: str, value: str) -> float:
+    def _get_confidence(self, pii_type: str) -> float:
         """Get confidence score for detected PII."""
-        confidence = 0.7  # Base confidence
-
-        # Increase confidence for validated patterns
-        if pii_type == "medicare" and self._validate_medicare(value):
-            confidence = 0.95
-        elif pii_type == "tfn" and self._validate_tfn(value):
-            confidence = 0.95
-        elif pii_type == "drivers_licence":
-            confidence = 0.85
-        elif pii_type == "mobile":
-            confidence = 0.80
-        elif pii_type == "credit_card":
-            confidence = 0.90
-
-        return confidence
-
-    def _calculate_pii_score(self, keyword_score: float, detections: List[PIIDetection]) -> float:
+        return _TYPE_CONFIDENCE.get(pii_type, 0.7)  # 0.7 base confidence
+
+    def _calculate_pii_score(
+        self, keyword_score: float, detections: List[PIIDetection], type_mask: int
+    ) -> float:
         """Calculate overall PII score from keyword and pattern scores."""
         pattern_score = min(len(detections) * 0.2, 0.8)  # Max 0.8 from patterns
         pii_score = min(keyword_score + pattern_score, 1.0)
 
-        # Boost score if multiple PII types detected
-        unique_types = len(set(d.type for d in detections))
-        if unique_types >= 2:
+        # Boost score if multiple PII types detected (clearing the lowest set
+        # bit leaves a non-zero mask only when two or more bits are set)
+        if type_mask & (type_mask - 1):
             pii_score = min(pii_score + 0.1, 1.0)
 
         return pii_score
@@ -211,15 +499,38 @@ class AustralianPIIInspector:
         if len(value) <= 4:
             return "****"
 
-        if pii_type in ["medicare", "tfn", "credit_card", "bank_account"]:
-            return value[:2] + "*" * (len(value) - 4) + value[-2:]
-        elif pii_type == "mobile":
-            return value[:4] + "***" + value[-3:]
-        elif pii_type == "email":
-            parts = value.split("@")
-            if len(parts) == 2:
-                return parts[0][:2] + "***@" + parts[1]
-        elif pii_type == "drivers_licence":
-            return value[:2] + "***" + value[-2:]
-
-        return value[:2] + "***" + value[-2:]
+        return _REDACTORS.get(pii_type, _redact_ends)(value)
+
+
+def _redact_middle(value: str) -> str:
+    """Mask everything but the first and last two characters, keeping the length."""
+    return value[:2] + "*" * (len(value) - 4) + value[-2:]
+
+
+def _redact_mobile(value: str) -> str:
+    """Keep the 04XX prefix and the last three digits of a mobile number."""
+    return value[:4] + "***" + value[-3:]
+
+
+def _redact_email(value: str) -> str:
+    """Keep the first two characters of the local part and the whole domain."""
+    parts = value.split("@")
+    if len(parts) == 2:
+        return parts[0][:2] + "***@" + parts[1]
+    return _redact_ends(value)
+
+
+def _redact_ends(value: str) -> str:
+    """Keep the first and last two characters around a fixed-width mask."""
+    return value[:2] + "***" + value[-2:]
+
+
+# Redaction by PII type; other types (driver's licence, BSB, postcode) use _redact_ends
+_REDACTORS = {
+    "medicare": _redact_middle,
+    "tfn": _redact_middle,
+    "credit_card": _redact_middle,
+    "bank_account": _redact_middle,
+    "mobile": _redact_mobile,
+    "email": _redact_email,
+}
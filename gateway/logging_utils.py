@@ -2,13 +2,65 @@
 Compliance audit logging utilities for the Sovereign AI Gateway.
 """
 
-import json
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional
 
-from .models import AuditLogEntry
+import orjson
+
+# Bytes read per step when scanning the audit log backwards for recent entries
+TAIL_READ_CHUNK_BYTES = 8192
+
+# Human-readable summary written after each JSON entry; see _summary_args()
+_SUMMARY_FORMAT = (
+    "[AUDIT] %s | Route: %s | PII Score: %.2f | PII Types: %s | Model: %s | Processing: %.1fms"
+)
+
+
+class _DeferredFormatQueueHandler(logging.handlers.QueueHandler):
+    """Queue records unformatted, so %-formatting runs on the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The queue stays in-process, so the record needs no pickling-safe copy
+        return record
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """
+    Append to the audit log through a large buffer, flushing in groups.
+
+    logging.FileHandler flushes after every record. This handler flushes
+    when the listener's queue has drained or max_pending records are
+    buffered, so a burst of records costs one write instead of one per record.
+    """
+
+    def __init__(self, filename: str, pending: queue.Queue, max_pending: int = 64):
+        super().__init__(filename, encoding="utf-8")
+        self._pending_queue = pending
+        self._max_pending = max_pending
+        self._buffered = 0
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, encoding=self.encoding, buffering=65536)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+            return
+
+        self._buffered += 1
+        if self._buffered >= self._max_pending or self._pending_queue.empty():
+            self.flush()
+
+    def flush(self) -> None:
+        super().flush()
+        self._buffered = 0
 
 
 class ComplianceLogger:
@@ -16,6 +68,8 @@ class ComplianceLogger:
     Handles compliance audit logging for data sovereignty enforcement.
 
     Logs to both file (sovereign_audit.log) and structured JSON format.
+    Records are queued and written by a background listener thread, so
+    logging calls do not wait on file I/O.
     """
 
     def __init__(self, log_file: str = "sovereign_audit.log"):
@@ -33,14 +87,17 @@ class ComplianceLogger:
         # Clear any existing handlers to avoid conflicts
         self.logger.handlers.clear()
 
-        # File handler for audit log
-        file_handler = logging.FileHandler(self.log_file)
+        # Callers only enqueue records; the listener thread does the writes
+        self._queue = queue.Queue()
+
+        # File handler for audit log, flushed once the queue drains
+        file_handler = _BufferedFileHandler(self.log_file, self._queue)
         file_handler.setLevel(logging.INFO)
+        self._file_handler = file_handler
 
         # JSON formatter for structured logging
         formatter = logging.Formatter("%(message)s", datefmt="%Y-%m-%d %H:%M:%S")
         file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
 
         # Also log to console in development
         console_handler = logging.StreamHandler()
@@ -49,7 +106,43 @@ class ComplianceLogger:
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
         )
         console_handler.setFormatter(console_formatter)
-        self.logger.addHandler(console_handler)
+
+        self._queue_handler = _DeferredFormatQueueHandler(self._queue)
+        self.logger.addHandler(self._queue_handler)
+        self._listener = logging.handlers.QueueListener(
+            self._queue, file_handler, console_handler, respect_handler_level=True
+        )
+        self._listener.start()
+        self._closed = False
+        atexit.register(self.close)
+
+    def flush(self) -> None:
+        """Block until every queued record has been written and flushed to the log file."""
+        if self._closed:
+            return  # Nothing is queued once closed; records are written directly
+        self._queue.join()
+        self._file_handler.flush()
+
+    def close(self) -> None:
+        """
+        Write any queued records, stop the listener thread and close the log file.
+
+        Records logged afterwards (e.g. by late writers during interpreter
+        shutdown) are appended to the log file directly, since nothing would
+        drain the queue any more.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        direct_handler = logging.FileHandler(self.log_file, encoding="utf-8", delay=True)
+        direct_handler.setLevel(logging.INFO)
+        direct_handler.setFormatter(self._file_handler.formatter)
+        self.logger.addHandler(direct_handler)
+        self.logger.removeHandler(self._queue_handler)
+
+        self._listener.stop()
+        self._file_handler.close()
 
     def log_request(
         self,
@@ -72,58 +165,117 @@ class ComplianceLogger:
         - ASD Essential 8 evidence
         - Data sovereignty verification
         """
-        entry = AuditLogEntry(
-            timestamp=datetime.now(),
+        log_data = self.build_entry(
             route=route,
             pii_score=pii_score,
             pii_types=pii_types,
             model_used=model_used,
-            user_id=user_id,
-            session_id=session_id,
-            ip_address=ip_address,
             prompt_length=prompt_length,
             response_length=response_length,
             processing_time_ms=processing_time_ms,
+            user_id=user_id,
+            session_id=session_id,
+            ip_address=ip_address,
         )
 
+        self._log_entry(log_data)
+
+    def _log_entry(self, log_data: dict) -> None:
+        """Queue the JSON line and human-readable summary for an entry."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
+        # Write JSON line to log file
+        self.logger.info("%s", orjson.dumps(log_data).decode())
+
+        # Also write human-readable summary, formatted lazily by the handlers
+        self.logger.info(_SUMMARY_FORMAT, *_summary_args(log_data))
+
+    def build_entry(
+        self,
+        route: str,
+        pii_score: float,
+        pii_types: list[str],
+        model_used: str,
+        prompt_length: int,
+        response_length: int,
+        processing_time_ms: float,
+        user_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        ip_address: Optional[str] = None,
+    ) -> dict:
+        """
+        Build the structured audit record for a gateway request.
+
+        The record has the fields of AuditLogEntry and is built directly as a
+        dict, since it is only ever serialized.
+
+        Returns:
+            Log entry as a JSON-serializable dictionary
+
+        Raises:
+            ValueError: If route is not "cloud" or "sovereign"
+        """
+        if route not in ("cloud", "sovereign"):
+            raise ValueError(f"route must be 'cloud' or 'sovereign', got {route!r}")
+
         # Log as JSON for structured querying
-        log_data = {
-            "timestamp": entry.timestamp.isoformat(),
-            "route": entry.route,
-            "pii_score": entry.pii_score,
-            "pii_types": entry.pii_types,
-            "model_used": entry.model_used,
-            "user_id": entry.user_id,
-            "session_id": entry.session_id,
-            "ip_address": entry.ip_address,
-            "prompt_length": entry.prompt_length,
-            "response_length": entry.response_length,
-            "processing_time_ms": entry.processing_time_ms,
-            "sovereignty_enforced": entry.route == "sovereign",
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "route": route,
+            "pii_score": pii_score,
+            "pii_types": pii_types,
+            "model_used": model_used,
+            "user_id": user_id,
+            "session_id": session_id,
+            "ip_address": ip_address,
+            "prompt_length": prompt_length,
+            "response_length": response_length,
+            "processing_time_ms": processing_time_ms,
+            "sovereignty_enforced": route == "sovereign",
         }
 
-        # Write JSON line to log file
-        self.logger.info(json.dumps(log_data))
-
-        # Also write human-readable summary
-        summary = (
-            f"[AUDIT] {entry.timestamp.isoformat()} | "
-            f"Route: {entry.route.upper()} | "
-            f"PII Score: {entry.pii_score:.2f} | "
-            f"PII Types: {', '.join(entry.pii_types) if entry.pii_types else 'None'} | "
-            f"Model: {entry.model_used} | "
-            f"Processing: {entry.processing_time_ms:.1f}ms"
-        )
-        self.logger.info(summary)
+    def write_batch(self, entries: list[dict]) -> None:
+        """
+        Log several entries from build_entry() and sync them to disk with one fsync.
 
-        # Flush handlers to ensure data is written
-        for handler in self.logger.handlers:
-            handler.flush()
+        Entries go through the same handlers as log_request() (the audit file
+        and the console); the call returns once they are written and synced.
 
-    def get_recent_logs(self, limit: int = 100) -> list[dict]:
+        Args:
+            entries: Log entries to append, oldest first
+        """
+        if not entries:
+            return
+
+        for log_data in entries:
+            self._log_entry(log_data)
+        self.flush()
+
+        # fsync applies to the file, so a separate descriptor syncs the handler's writes
+        with open(self.log_file, "ab") as f:
+            os.fsync(f.fileno())
+
+    def get_recent_logs(
+        self,
+        limit: int = 100,
+        before: Optional[datetime] = None,
+        after: Optional[datetime] = None,
+        route: Optional[str] = None,
+        before_offset: Optional[int] = None,
+    ) -> list[dict]:
         """
         Read recent log entries from the audit log file.
 
+        Args:
+            limit: Maximum number of entries to return
+            before: Only return entries logged strictly before this time
+            after: Only return entries logged strictly after this time
+            route: Only return entries with this route
+            before_offset: If given, ``before`` is inclusive: entries logged
+                exactly at ``before`` are returned after skipping this many of
+                them (newest first), i.e. those already seen on earlier pages
+
         Returns:
             List of parsed log entries (most recent first)
         """
@@ -132,21 +284,101 @@ class ComplianceLogger:
         if not os.path.exists(self.log_file):
             return logs
 
+        # Include entries still waiting in the queue
+        self.flush()
+
+        entries = _filter_entries(
+            self._iter_entries_newest_first(),
+            before=_as_local_naive(before),
+            after=_as_local_naive(after),
+            route=route,
+            before_offset=before_offset,
+        )
         try:
-            with open(self.log_file, "r") as f:
-                lines = f.readlines()
-
-            # Parse JSON lines (most recent at end)
-            for line in reversed(lines[-limit:]):
-                line = line.strip()
-                if line.startswith("{"):
-                    try:
-                        log_entry = json.loads(line)
-                        logs.append(log_entry)
-                    except json.JSONDecodeError:
-                        continue
+            for log_entry in entries:
+                logs.append(log_entry)
+                if len(logs) >= limit:
+                    break
 
         except Exception as e:
             self.logger.error(f"Error reading audit log: {e}")
 
         return logs
+
+    def _iter_entries_newest_first(self) -> Iterator[dict]:
+        """Yield parsed JSON entries from the audit log file, most recent first."""
+        # Parse JSON lines from the end of the file, skipping the summary lines
+        for line in _iter_lines_reversed(self.log_file):
+            if line.startswith(b"{"):
+                try:
+                    yield orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue
+
+
+def _filter_entries(
+    entries: Iterator[dict],
+    before: Optional[datetime],
+    after: Optional[datetime],
+    route: Optional[str],
+    before_offset: Optional[int],
+) -> Iterator[dict]:
+    """Yield the newest-first entries matching get_recent_logs()'s filters."""
+    to_skip = before_offset
+    for log_entry in entries:
+        at_before = False
+        if before or after:
+            timestamp = datetime.fromisoformat(log_entry["timestamp"])
+            if after and timestamp <= after:
+                return  # Entries are chronological, the rest are older
+            if before and timestamp >= before:
+                if to_skip is None or timestamp > before:
+                    continue
+                at_before = True
+        if route and log_entry.get("route") != route:
+            continue
+        if at_before and to_skip > 0:
+            to_skip -= 1
+            continue
+        yield log_entry
+
+
+def _iter_lines_reversed(path: str, chunk_size: int = TAIL_READ_CHUNK_BYTES) -> Iterator[bytes]:
+    """
+    Yield the lines of a file from last to first, reading backwards in chunks.
+
+    Only the chunks needed by the consumer are read, so fetching the newest
+    entries does not depend on the size of the file.
+    """
+    with open(path, "rb") as f:
+        position = f.seek(0, os.SEEK_END)
+        partial = b""
+        while position > 0:
+            read_size = min(chunk_size, position)
+            position -= read_size
+            f.seek(position)
+            lines = (f.read(read_size) + partial).split(b"\n")
+            # The first piece may continue in the previous chunk
+            partial = lines.pop(0)
+            yield from reversed(lines)
+        yield partial
+
+
+def _summary_args(log_data: dict) -> tuple:
+    """Return the _SUMMARY_FORMAT arguments for a log entry."""
+    pii_types = log_data["pii_types"]
+    return (
+        log_data["timestamp"],
+        log_data["route"].upper(),
+        log_data["pii_score"],
+        ", ".join(pii_types) if pii_types else "None",
+        log_data["model_used"],
+        log_data["processing_time_ms"],
+    )
+
+
+def _as_local_naive(value: Optional[datetime]) -> Optional[datetime]:
+    """Convert an aware datetime to naive local time, matching logged timestamps."""
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone().replace(tzinfo=None)
+    return value
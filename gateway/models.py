@@ -2,32 +2,49 @@
 Data models for the Sovereign AI Gateway.
 """
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class GatewayRequest(BaseModel):
     """Request model for the gateway endpoint."""
 
+    model_config = ConfigDict(frozen=True)
+
     prompt: str = Field(..., description="User prompt to be processed")
     user_id: Optional[str] = Field(None, description="Optional user identifier")
     session_id: Optional[str] = Field(None, description="Optional session identifier")
 
 
-class PIIDetection(BaseModel):
-    """PII detection result."""
+@dataclass(frozen=True, slots=True)
+class PIIDetection:
+    """
+    PII detection result.
+
+    Built internally by the inspector for every match, so it is a slotted
+    dataclass rather than a pydantic model; only the confidence range is checked.
+    Frozen, since the gateway's PII cache shares detections across requests.
+    """
+
+    type: str  # Type of PII detected
+    value: str  # Detected value (may be redacted)
+    confidence: float  # Detection confidence score
+    position: Optional[tuple] = None  # Position in text (start, end)
 
-    type: str = Field(..., description="Type of PII detected")
-    value: str = Field(..., description="Detected value (may be redacted)")
-    confidence: float = Field(..., ge=0.0, le=1.0, description="Detection confidence score")
-    position: Optional[tuple] = Field(None, description="Position in text (start, end)")
+    def __post_init__(self):
+        if not 0.0 <= self.confidence <= 1.0:
+            raise ValueError(f"confidence must be between 0.0 and 1.0, got {self.confidence}")
 
 
 class GatewayResponse(BaseModel):
     """Response model from the gateway endpoint."""
 
+    # model_used is an API field name, not a pydantic "model_" attribute
+    model_config = ConfigDict(frozen=True, protected_namespaces=())
+
     response: str = Field(..., description="AI model response")
     route: Literal["cloud", "sovereign"] = Field(..., description="Routing decision")
     pii_score: float = Field(..., ge=0.0, le=1.0, description="PII sensitivity score")
@@ -39,10 +56,11 @@ class GatewayResponse(BaseModel):
     processing_time_ms: Optional[float] = Field(None, description="Processing time in milliseconds")
 
 
-class AuditLogEntry(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class AuditLogEntry:
     """Audit log entry for compliance."""
 
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = field(default_factory=datetime.now)
     route: Literal["cloud", "sovereign"]
     pii_score: float
     pii_types: List[str]
@@ -53,3 +71,7 @@ class AuditLogEntry(BaseModel):
     prompt_length: int
     response_length: int
     processing_time_ms: float
+
+    def __post_init__(self):
+        if self.route not in ("cloud", "sovereign"):
+            raise ValueError(f"route must be 'cloud' or 'sovereign', got {self.route!r}")
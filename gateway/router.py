@@ -5,26 +5,57 @@ This module handles the routing logic and LLM API invocations for both
 cloud (OpenAI) and local (Ollama) models.
 """
 
+import json
 import logging
 import time
-from typing import Tuple
+from typing import Any, AsyncIterator, Dict, Optional, Tuple, Union
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .config import config
 from .models import PIIDetection
 
 logger = logging.getLogger(__name__)
 
+# Upstream responses from either HTTP client expose status_code, json() and text
+UpstreamResponse = Union[requests.Response, httpx.Response]
+
+# Upstream failures from either HTTP client, most specific first (see _error_response)
+_CONNECT_ERRORS = (requests.exceptions.ConnectionError, httpx.ConnectError)
+_TIMEOUT_ERRORS = (requests.exceptions.Timeout, httpx.TimeoutException)
+_REQUEST_ERRORS = (requests.exceptions.RequestException, httpx.HTTPError)
+
+_OPENAI_KEY_MISSING_RESPONSE = "[ERROR] OpenAI API key not configured. Falling back to local model."
+
 
 class LLMRouter:
     """
     Routes prompts to either cloud AI (OpenAI) or local LLM (Ollama)
     based on PII sensitivity score.
+
+    Blocking callers use route_and_infer(), which reuses connections
+    through one requests.Session; the FastAPI gateway uses
+    route_and_infer_async(), which shares one pooled httpx.AsyncClient
+    across requests so upstream calls do not block the event loop.
     """
 
-    def __init__(self):
-        """Initialize the LLM router with configuration."""
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        session: Optional[requests.Session] = None,
+    ):
+        """
+        Initialize the LLM router with configuration.
+
+        Args:
+            client: Shared HTTP client for async upstream calls. A pooled
+                keep-alive client is created when not provided.
+            session: Shared session for blocking upstream calls. A pooled
+                keep-alive session is created when not provided.
+        """
         self.openai_api_key = config.openai_api_key or ""
         self.openai_base_url = config.openai_base_url
         self.openai_model = config.openai_model
@@ -36,12 +67,47 @@ class LLMRouter:
         self.ollama_timeout = config.ollama_timeout
 
         self.pii_threshold = config.pii_threshold
+        self._model_names = {
+            "cloud": self.openai_model,
+            "sovereign": f"{self.ollama_model} (local)",
+        }
+
+        # Request parts that do not depend on the prompt are built once; the
+        # HTTP clients only read these, so they are shared across calls
+        self._openai_headers = {
+            "Authorization": f"Bearer {self.openai_api_key}",
+            "Content-Type": "application/json",
+        }
+        self._openai_payload_base = {
+            "model": self.openai_model,
+            "max_tokens": self.openai_max_tokens,
+            "temperature": 0.7,
+        }
+
+        self.client = client or httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+        )
+        self.session = session or self._create_session()
 
         logger.info(
             f"Router initialized: threshold={self.pii_threshold}, "
             f"openai_model={self.openai_model}, ollama_model={self.ollama_model}"
         )
 
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Create a keep-alive session that retries failed connection attempts."""
+        session = requests.Session()
+        # Only connecting is retried; a POST that reached the upstream is not resent
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=64,
+            max_retries=Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.2),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
     def route_and_infer(
         self, prompt: str, pii_detections: list[PIIDetection], pii_score: float
     ) -> Tuple[str, str, float]:
@@ -59,27 +125,165 @@ class LLMRouter:
         Raises:
             ValueError: If prompt is empty or invalid
         """
+        self._validate_inputs(prompt, pii_score)
+
+        start_time = time.perf_counter_ns()
+
+        route = self.choose_route(pii_detections, pii_score)
+        if route == "sovereign":
+            response = self._call_ollama(prompt)
+        else:
+            response = self._call_openai(prompt)
+
+        processing_time = (time.perf_counter_ns() - start_time) / 1e6  # Convert to ms
+
+        return response, route, processing_time
+
+    async def route_and_infer_async(
+        self, prompt: str, pii_detections: list[PIIDetection], pii_score: float
+    ) -> Tuple[str, str, float]:
+        """
+        Async variant of route_and_infer() for use on the event loop.
+
+        Args:
+            prompt: User prompt
+            pii_detections: List of detected PII
+            pii_score: Overall PII sensitivity score
+
+        Returns:
+            Tuple of (response_text, route_used, processing_time_ms)
+
+        Raises:
+            ValueError: If prompt is empty or invalid
+        """
+        self._validate_inputs(prompt, pii_score)
+
+        start_time = time.perf_counter_ns()
+
+        route = self.choose_route(pii_detections, pii_score)
+        if route == "sovereign":
+            response = await self._call_ollama_async(prompt)
+        else:
+            response = await self._call_openai_async(prompt)
+
+        processing_time = (time.perf_counter_ns() - start_time) / 1e6  # Convert to ms
+
+        return response, route, processing_time
+
+    @staticmethod
+    def _validate_inputs(prompt: str, pii_score: float) -> None:
+        """Validate routing inputs shared by the sync and async paths."""
         if not prompt or not isinstance(prompt, str):
             raise ValueError("Prompt must be a non-empty string")
 
         if not isinstance(pii_score, (int, float)) or pii_score < 0 or pii_score > 1:
             raise ValueError(f"PII score must be between 0.0 and 1.0, got {pii_score}")
 
-        start_time = time.time()
+    def choose_route(self, pii_detections: list[PIIDetection], pii_score: float) -> str:
+        """
+        Decide where a prompt should be processed.
+
+        Any detected PII, or a score at or above the threshold, keeps the
+        prompt on the sovereign (local) model.
 
-        # Routing decision
+        Returns:
+            "sovereign" or "cloud"
+        """
         if pii_score >= self.pii_threshold or len(pii_detections) > 0:
-            # Route to sovereign (local) LLM
-            route = "sovereign"
-            response = self._call_ollama(prompt)
-        else:
-            # Route to cloud LLM
-            route = "cloud"
-            response = self._call_openai(prompt)
+            return "sovereign"
+        return "cloud"
 
-        processing_time = (time.time() - start_time) * 1000  # Convert to ms
+    def stream_infer(self, prompt: str, route: str) -> AsyncIterator[str]:
+        """
+        Stream inference output for an already-routed prompt.
 
-        return response, route, processing_time
+        Args:
+            prompt: User prompt text
+            route: Routing decision from choose_route()
+
+        Yields:
+            Response text chunks as they arrive; failures are yielded as a
+            single "[ERROR] ..." chunk, matching the non-streaming calls
+        """
+        if route == "sovereign":
+            return self._stream_ollama(prompt)
+        return self._stream_openai(prompt)
+
+    def _openai_request(
+        self, prompt: str, stream: bool = False
+    ) -> Tuple[Dict[str, str], Dict[str, Any]]:
+        """Build the headers and payload for an OpenAI chat completion."""
+        payload = {
+            **self._openai_payload_base,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+        if stream:
+            payload["stream"] = True
+
+        return self._openai_headers, payload
+
+    def _ollama_payload(self, prompt: str, stream: bool = False) -> Dict[str, Any]:
+        """Build the payload for an Ollama generation."""
+        return {"model": self.ollama_model, "prompt": prompt, "stream": stream}
+
+    @staticmethod
+    def _parse_openai_response(response: UpstreamResponse) -> str:
+        """Extract the completion text, or an error message, from an OpenAI response."""
+        if response.status_code == 200:
+            result = response.json()
+            content = result["choices"][0]["message"]["content"]
+            logger.debug(f"OpenAI API call successful, response length: {len(content)}")
+            return content
+
+        return LLMRouter._status_error("OpenAI", response)
+
+    @staticmethod
+    def _parse_ollama_response(response: UpstreamResponse) -> str:
+        """Extract the generated text, or an error message, from an Ollama response."""
+        if response.status_code == 200:
+            result = response.json()
+            content = result.get("response", "[ERROR] No response from Ollama")
+            logger.debug(f"Ollama API call successful, response length: {len(content)}")
+            return content
+
+        return LLMRouter._status_error("Ollama", response)
+
+    @staticmethod
+    def _status_error(backend: str, response: UpstreamResponse) -> str:
+        """Log a non-200 upstream response and build the error text returned for it."""
+        error_msg = f"{backend} API error: {response.status_code} - {response.text}"
+        logger.error(error_msg)
+        return f"[ERROR] {error_msg}"
+
+    def _error_response(self, route: str, exc: Exception) -> str:
+        """
+        Log a failed upstream call and build the error text returned for it.
+
+        Shared by the blocking, async and streaming calls, so requests and
+        httpx failures produce the same messages.
+
+        Args:
+            route: "cloud" (OpenAI) or "sovereign" (Ollama)
+            exc: Exception raised by the upstream call
+        """
+        if route == "sovereign":
+            backend, timeout = "Ollama", self.ollama_timeout
+        else:
+            backend, timeout = "OpenAI", self.openai_timeout
+
+        if route == "sovereign" and isinstance(exc, _CONNECT_ERRORS):
+            error_msg = "Cannot connect to Ollama. Ensure Ollama is running and accessible."
+            logger.error(error_msg)
+        elif isinstance(exc, _TIMEOUT_ERRORS):
+            error_msg = f"{backend} API timeout after {timeout}s"
+            logger.error(error_msg)
+        elif isinstance(exc, _REQUEST_ERRORS):
+            error_msg = f"{backend} API request failed: {str(exc)}"
+            logger.error(error_msg, exc_info=exc)
+        else:
+            error_msg = f"{backend} API call failed: {str(exc)}"
+            logger.error(error_msg, exc_info=exc)
+        return f"[ERROR] {error_msg}"
 
     def _call_openai(self, prompt: str) -> str:
         """
@@ -93,52 +297,24 @@ class LLMRouter:
         """
         if not self.openai_api_key:
             logger.warning("OpenAI API key not configured")
-            return "[ERROR] OpenAI API key not configured. Falling back to local model."
+            return _OPENAI_KEY_MISSING_RESPONSE
 
         try:
             logger.debug(f"Calling OpenAI API with model: {self.openai_model}")
 
-            headers = {
-                "Authorization": f"Bearer {self.openai_api_key}",
-                "Content-Type": "application/json",
-            }
-
-            payload = {
-                "model": self.openai_model,
-                "messages": [{"role": "user", "content": prompt}],
-                "max_tokens": self.openai_max_tokens,
-                "temperature": 0.7,
-            }
+            headers, payload = self._openai_request(prompt)
 
-            response = requests.post(
+            response = self.session.post(
                 f"{self.openai_base_url}/chat/completions",
                 headers=headers,
                 json=payload,
                 timeout=self.openai_timeout,
             )
 
-            if response.status_code == 200:
-                result = response.json()
-                content = result["choices"][0]["message"]["content"]
-                logger.debug(f"OpenAI API call successful, response length: {len(content)}")
-                return content
-            else:
-                error_msg = f"OpenAI API error: {response.status_code} - {response.text}"
-                logger.error(error_msg)
-                return f"[ERROR] {error_msg}"
-
-        except requests.exceptions.Timeout:
-            error_msg = f"OpenAI API timeout after {self.openai_timeout}s"
-            logger.error(error_msg)
-            return f"[ERROR] {error_msg}"
-        except requests.exceptions.RequestException as e:
-            error_msg = f"OpenAI API request failed: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            return f"[ERROR] {error_msg}"
+            return self._parse_openai_response(response)
+
         except Exception as e:
-            error_msg = f"OpenAI API call failed: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            return f"[ERROR] {error_msg}"
+            return self._error_response("cloud", e)
 
     def _call_ollama(self, prompt: str) -> str:
         """
@@ -153,42 +329,145 @@ class LLMRouter:
         try:
             logger.debug(f"Calling Ollama API with model: {self.ollama_model}")
 
-            payload = {"model": self.ollama_model, "prompt": prompt, "stream": False}
+            response = self.session.post(
+                f"{self.ollama_base_url}/api/generate",
+                json=self._ollama_payload(prompt),
+                timeout=self.ollama_timeout,
+            )
 
-            response = requests.post(
-                f"{self.ollama_base_url}/api/generate", json=payload, timeout=self.ollama_timeout
+            return self._parse_ollama_response(response)
+
+        except Exception as e:
+            return self._error_response("sovereign", e)
+
+    async def _call_openai_async(self, prompt: str) -> str:
+        """
+        Call OpenAI API for inference without blocking the event loop.
+
+        Args:
+            prompt: User prompt text
+
+        Returns:
+            AI-generated response text or error message
+        """
+        if not self.openai_api_key:
+            logger.warning("OpenAI API key not configured")
+            return _OPENAI_KEY_MISSING_RESPONSE
+
+        try:
+            logger.debug(f"Calling OpenAI API with model: {self.openai_model}")
+
+            headers, payload = self._openai_request(prompt)
+
+            response = await self.client.post(
+                f"{self.openai_base_url}/chat/completions",
+                headers=headers,
+                json=payload,
+                timeout=self.openai_timeout,
             )
 
-            if response.status_code == 200:
-                result = response.json()
-                content = result.get("response", "[ERROR] No response from Ollama")
-                logger.debug(f"Ollama API call successful, response length: {len(content)}")
-                return content
-            else:
-                error_msg = f"Ollama API error: {response.status_code} - {response.text}"
-                logger.error(error_msg)
-                return f"[ERROR] {error_msg}"
-
-        except requests.exceptions.ConnectionError:
-            error_msg = "Cannot connect to Ollama. Ensure Ollama is running and accessible."
-            logger.error(error_msg)
-            return f"[ERROR] {error_msg}"
-        except requests.exceptions.Timeout:
-            error_msg = f"Ollama API timeout after {self.ollama_timeout}s"
-            logger.error(error_msg)
-            return f"[ERROR] {error_msg}"
-        except requests.exceptions.RequestException as e:
-            error_msg = f"Ollama API request failed: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            return f"[ERROR] {error_msg}"
+            return self._parse_openai_response(response)
+
         except Exception as e:
-            error_msg = f"Ollama API call failed: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            return f"[ERROR] {error_msg}"
+            return self._error_response("cloud", e)
+
+    async def _call_ollama_async(self, prompt: str) -> str:
+        """
+        Call Ollama local LLM for inference without blocking the event loop.
+
+        Args:
+            prompt: User prompt text
+
+        Returns:
+            AI-generated response text or error message
+        """
+        try:
+            logger.debug(f"Calling Ollama API with model: {self.ollama_model}")
+
+            response = await self.client.post(
+                f"{self.ollama_base_url}/api/generate",
+                json=self._ollama_payload(prompt),
+                timeout=self.ollama_timeout,
+            )
+
+            return self._parse_ollama_response(response)
+
+        except Exception as e:
+            return self._error_response("sovereign", e)
+
+    async def _stream_openai(self, prompt: str) -> AsyncIterator[str]:
+        """Stream an OpenAI chat completion (server-sent events)."""
+        if not self.openai_api_key:
+            logger.warning("OpenAI API key not configured")
+            yield _OPENAI_KEY_MISSING_RESPONSE
+            return
+
+        headers, payload = self._openai_request(prompt, stream=True)
+
+        try:
+            async with self.client.stream(
+                "POST",
+                f"{self.openai_base_url}/chat/completions",
+                headers=headers,
+                json=payload,
+                timeout=self.openai_timeout,
+            ) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    yield self._status_error("OpenAI", response)
+                    return
+
+                async for delta in self._iter_openai_deltas(response):
+                    yield delta
+
+        except Exception as e:
+            yield self._error_response("cloud", e)
+
+    async def _stream_ollama(self, prompt: str) -> AsyncIterator[str]:
+        """Stream an Ollama generation (newline-delimited JSON)."""
+        try:
+            async with self.client.stream(
+                "POST",
+                f"{self.ollama_base_url}/api/generate",
+                json=self._ollama_payload(prompt, stream=True),
+                timeout=self.ollama_timeout,
+            ) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    yield self._status_error("Ollama", response)
+                    return
+
+                async for chunk in self._iter_ollama_chunks(response):
+                    yield chunk
+
+        except Exception as e:
+            yield self._error_response("sovereign", e)
+
+    @staticmethod
+    async def _iter_openai_deltas(response: httpx.Response) -> AsyncIterator[str]:
+        """Extract content deltas from an OpenAI server-sent event stream."""
+        async for line in response.aiter_lines():
+            if not line.startswith("data: "):
+                continue
+            data = line[len("data: ") :]
+            if data == "[DONE]":
+                break
+            delta = json.loads(data)["choices"][0]["delta"].get("content")
+            if delta:
+                yield delta
+
+    @staticmethod
+    async def _iter_ollama_chunks(response: httpx.Response) -> AsyncIterator[str]:
+        """Extract response text from an Ollama newline-delimited JSON stream."""
+        async for line in response.aiter_lines():
+            if not line:
+                continue
+            chunk = json.loads(line)
+            if chunk.get("response"):
+                yield chunk["response"]
+            if chunk.get("done"):
+                break
 
     def get_model_name(self, route: str) -> str:
         """Get the model name used for a given route."""
-        if route == "cloud":
-            return self.openai_model
-        else:
-            return f"{self.ollama_model} (local)"
+        return self._model_names.get(route, self._model_names["sovereign"])
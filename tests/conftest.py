@@ -0,0 +1,13 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+
+from gateway.inspector import AustralianPIIInspector
+
+
+@pytest.fixture(scope="session")
+def inspector():
+    """Create one inspector for the session; detection does not mutate it."""
+    return AustralianPIIInspector()
@@ -2,10 +2,15 @@
 Integration tests for the FastAPI gateway.
 """
 
+import asyncio
+import json
+from unittest.mock import patch
+
 import pytest
 from fastapi.testclient import TestClient
 
-from gateway.gateway import app
+from gateway.gateway import app, flush_audit_queue, inspect_prompt, inspector
+from gateway.logging_utils import ComplianceLogger
 
 
 @pytest.fixture
@@ -38,6 +43,7 @@ def test_health_endpoint(client):
     data = response.json()
     assert data["status"] == "healthy"
     assert "components" in data
+    assert data["pii_engines"]["patterns"] == "re"
 
 
 def test_gateway_endpoint_clean_prompt(client):
@@ -59,7 +65,7 @@ def test_gateway_endpoint_clean_prompt(client):
 
 def test_gateway_endpoint_sensitive_prompt(client):
     """Test gateway endpoint with sensitive prompt."""
-    payload = {"prompt": "My Medicare number is 1234 567 890", "user_id": "test_user"}
+    payload = {"prompt": "My Medicare number is 2123 456 701", "user_id": "test_user"}
 
     response = client.post("/gateway", json=payload)
     assert response.status_code == 200
@@ -77,6 +83,17 @@ def test_gateway_endpoint_empty_prompt(client):
     assert response.status_code == 400
 
 
+def test_gateway_endpoint_oversized_prompt(client):
+    """Test gateway endpoint rejects prompts over the byte limit."""
+    with patch("gateway.gateway.config.max_request_size", 8):
+        # 3 characters but 9 bytes in UTF-8
+        response = client.post("/gateway", json={"prompt": "日本語"})
+        assert response.status_code == 413
+
+        response = client.post("/gateway", json={"prompt": "ab"})
+        assert response.status_code != 413
+
+
 def test_gateway_endpoint_missing_prompt(client):
     """Test gateway endpoint with missing prompt."""
     payload = {}
@@ -110,3 +127,124 @@ def test_audit_endpoint_invalid_limit(client):
 
     response = client.get("/audit/recent?limit=2000")
     assert response.status_code == 400
+
+
+def test_audit_endpoint_filters(client):
+    """Test audit log endpoint filter parameters."""
+    response = client.get("/audit/recent?route=sovereign&before=2100-01-01T00:00:00")
+    assert response.status_code == 200
+    data = response.json()
+    assert all(log["route"] == "sovereign" for log in data["logs"])
+    assert "next_before" in data
+
+    response = client.get("/audit/recent?route=elsewhere")
+    assert response.status_code == 400
+
+
+def test_audit_endpoint_pages_through_shared_timestamps(client, tmp_path):
+    """Test paging returns every entry when several share the page-boundary timestamp."""
+    audit_logger = ComplianceLogger(log_file=str(tmp_path / "audit.log"))
+    entries = []
+    for i, timestamp in enumerate(["2024-01-15T10:00:00"] + ["2024-01-15T10:30:00"] * 4):
+        entry = audit_logger.build_entry(
+            route="cloud",
+            pii_score=0.0,
+            pii_types=[],
+            model_used="gpt-4o",
+            prompt_length=10,
+            response_length=i,
+            processing_time_ms=1.0,
+        )
+        entry["timestamp"] = timestamp
+        entries.append(entry)
+    audit_logger.write_batch(entries)
+
+    seen = []
+    params = {"limit": 2}
+    with patch("gateway.gateway.audit_logger", audit_logger):
+        while True:
+            data = client.get("/audit/recent", params=params).json()
+            seen.extend(log["response_length"] for log in data["logs"])
+            if data["next_before"] is None:
+                break
+            params.update(before=data["next_before"], before_offset=data["next_before_offset"])
+
+    assert seen == [4, 3, 2, 1, 0]
+
+
+def test_gateway_stream_endpoint(client):
+    """Test streaming gateway endpoint emits metadata, chunks and a final event."""
+    payload = {"prompt": "My Medicare number is 2123 456 701", "user_id": "test_user"}
+
+    response = client.post("/gateway/stream", json=payload)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    events = [json.loads(line) for line in response.text.splitlines() if line]
+    assert events[0]["route"] == "sovereign"
+    assert len(events[0]["pii_detected"]) > 0
+    assert all("response" in event for event in events[1:-1])
+    assert events[-1]["done"] is True
+    assert events[-1]["processing_time_ms"] >= 0
+
+
+def test_gateway_stream_endpoint_is_not_compressed(client):
+    """Test the NDJSON stream bypasses gzip while larger JSON bodies are compressed."""
+    headers = {"Accept-Encoding": "gzip"}
+    payload = {"prompt": "What is the capital of Australia?"}
+
+    response = client.post("/gateway/stream", json=payload, headers=headers)
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+
+    response = client.get("/openapi.json", headers=headers)
+    assert response.headers["content-encoding"] == "gzip"
+
+
+def test_gateway_stream_endpoint_empty_prompt(client):
+    """Test streaming gateway endpoint rejects empty prompts."""
+    response = client.post("/gateway/stream", json={"prompt": "   "})
+    assert response.status_code == 400
+
+
+def test_inspect_prompt_reuses_cached_result():
+    """Test that repeated prompts are served from the PII cache."""
+    prompt = "Cache probe: my TFN is 987654321"
+    first = inspect_prompt(prompt)
+
+    with patch.object(inspector, "detect_pii") as detect_pii:
+        second = inspect_prompt(prompt)
+        detect_pii.assert_not_called()
+
+    assert second[1] == first[1]
+    assert [d.type for d in second[0]] == [d.type for d in first[0]]
+
+
+def test_flush_audit_queue_writes_batches(tmp_path):
+    """Test the audit writer drains queued entries before stopping."""
+    audit_logger = ComplianceLogger(log_file=str(tmp_path / "audit.log"))
+    entries = [
+        audit_logger.build_entry(
+            route="cloud",
+            pii_score=0.0,
+            pii_types=[],
+            model_used="gpt-4o",
+            prompt_length=10,
+            response_length=20,
+            processing_time_ms=float(i),
+        )
+        for i in range(5)
+    ]
+
+    async def run():
+        queue = asyncio.Queue()
+        for entry in entries:
+            queue.put_nowait(entry)
+        queue.put_nowait(None)
+        await flush_audit_queue(queue, audit_logger)
+
+    with patch.object(audit_logger, "write_batch", wraps=audit_logger.write_batch) as write:
+        asyncio.run(run())
+        write.assert_called_once()
+
+    assert len(audit_logger.get_recent_logs()) == 5
@@ -2,13 +2,10 @@
 Tests for PII Inspector module.
 """
 
-from gateway.inspector import AustralianPIIInspector
 
-
-def test_medicare_detection():
+def test_medicare_detection(inspector):
     """Test Medicare number detection."""
-    inspector = AustralianPIIInspector()
-    text = "My Medicare number is 1234 567 890"
+    text = "My Medicare number is 2123 456 701"
     detections, score = inspector.detect_pii(text)
 
     assert len(detections) > 0
@@ -16,10 +13,18 @@ def test_medicare_detection():
     assert score > 0
 
 
-def test_tfn_detection():
+def test_medicare_detection_non_ascii_digits(inspector):
+    """Test Medicare numbers written in full-width digits are still detected."""
+    text = "My Medicare number is ２１２３ ４５６ ７０１"
+    detections, score = inspector.detect_pii(text)
+
+    assert [d.type for d in detections] == ["medicare"]
+    assert score >= 0.3
+
+
+def test_tfn_detection(inspector):
     """Test TFN detection."""
-    inspector = AustralianPIIInspector()
-    text = "My TFN is 123456789"
+    text = "My TFN is 123456782"
     detections, score = inspector.detect_pii(text)
 
     assert len(detections) > 0
@@ -27,9 +32,8 @@ def test_tfn_detection():
     assert score > 0
 
 
-def test_mobile_detection():
+def test_mobile_detection(inspector):
     """Test Australian mobile number detection."""
-    inspector = AustralianPIIInspector()
     text = "Call me on 0412 345 678"
     detections, score = inspector.detect_pii(text)
 
@@ -38,28 +42,34 @@ def test_mobile_detection():
     assert score > 0
 
 
-def test_sensitive_keywords():
+def test_overlapping_patterns_report_one_type(inspector):
+    """Test an identifier is reported once, as its highest-priority type."""
+    detections, _ = inspector.detect_pii("Call me on 0412 345 678")
+    assert [d.type for d in detections] == ["mobile"]
+
+    detections, _ = inspector.detect_pii("My Medicare number is 2123 456 701")
+    assert [d.type for d in detections] == ["medicare"]
+
+
+def test_sensitive_keywords(inspector):
     """Test sensitive keyword detection."""
-    inspector = AustralianPIIInspector()
     text = "I need medical advice about my diagnosis"
     detections, score = inspector.detect_pii(text)
 
     assert score > 0
 
 
-def test_clean_text():
+def test_clean_text(inspector):
     """Test that clean text has low PII score."""
-    inspector = AustralianPIIInspector()
     text = "What is the capital of Australia?"
     detections, score = inspector.detect_pii(text)
 
     assert score < 0.3
 
 
-def test_multiple_pii():
+def test_multiple_pii(inspector):
     """Test detection of multiple PII types."""
-    inspector = AustralianPIIInspector()
-    text = "My Medicare is 1234 567 890 and my TFN is 123456789"
+    text = "My Medicare is 2123 456 701 and my TFN is 123456782"
     detections, score = inspector.detect_pii(text)
 
     assert len(detections) >= 2
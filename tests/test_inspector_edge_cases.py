@@ -7,40 +7,35 @@ import pytest
 from gateway.inspector import AustralianPIIInspector
 
 
-def test_detect_pii_empty_string():
+def test_detect_pii_empty_string(inspector):
     """Test PII detection with empty string."""
-    inspector = AustralianPIIInspector()
     detections, score = inspector.detect_pii("")
     assert len(detections) == 0
     assert score == 0.0
 
 
-def test_detect_pii_none():
+def test_detect_pii_none(inspector):
     """Test PII detection with None (should raise TypeError)."""
-    inspector = AustralianPIIInspector()
     with pytest.raises(TypeError):
         inspector.detect_pii(None)
 
 
-def test_detect_pii_non_string():
+def test_detect_pii_non_string(inspector):
     """Test PII detection with non-string input."""
-    inspector = AustralianPIIInspector()
     with pytest.raises(TypeError):
         inspector.detect_pii(123)
 
 
-def test_detect_pii_very_long_text():
+def test_detect_pii_very_long_text(inspector):
     """Test PII detection with very long text."""
-    inspector = AustralianPIIInspector()
-    long_text = "This is a test. " * 1000 + "My Medicare number is 1234 567 890"
+    long_text = "This is a test. " * 1000 + "My Medicare number is 2123 456 701"
     detections, score = inspector.detect_pii(long_text)
     assert len(detections) > 0
     assert score > 0
 
 
-def test_detect_pii_special_characters():
+def test_detect_pii_special_characters(inspector):
     """Test PII detection with special characters."""
-    inspector = AustralianPIIInspector()
     text = "Contact me at test@example.com or call 0412 345 678"
     detections, score = inspector.detect_pii(text)
     # Should detect email and mobile
@@ -48,46 +43,153 @@ def test_detect_pii_special_characters():
     assert score > 0
 
 
-def test_detect_pii_multiple_medicare():
+def test_detect_pii_multiple_medicare(inspector):
     """Test detection of multiple Medicare numbers."""
-    inspector = AustralianPIIInspector()
-    text = "Medicare 1234 567 890 and also 9876 543 210"
+    text = "Medicare 2123 456 701 and also 3950 123 491"
     detections, score = inspector.detect_pii(text)
     assert len(detections) >= 2
     assert score > 0.5
 
 
-def test_detect_pii_whitespace_only():
+def test_detect_pii_whitespace_only(inspector):
     """Test PII detection with whitespace-only string."""
-    inspector = AustralianPIIInspector()
     detections, score = inspector.detect_pii("   \n\t   ")
     assert len(detections) == 0
     assert score == 0.0
 
 
-def test_redact_value_short():
+def test_redact_value_short(inspector):
     """Test redaction of very short values."""
-    inspector = AustralianPIIInspector()
     result = inspector._redact_value("123", "medicare")
     assert result == "****"
 
 
-def test_redact_value_empty():
+def test_redact_value_empty(inspector):
     """Test redaction of empty value."""
-    inspector = AustralianPIIInspector()
     result = inspector._redact_value("", "medicare")
     assert result == "****"
 
 
-def test_validate_medicare_invalid_format():
+def test_validate_medicare_invalid_format(inspector):
     """Test Medicare validation with invalid format."""
-    inspector = AustralianPIIInspector()
     assert inspector._validate_medicare("123") is False
     assert inspector._validate_medicare("123456789012") is False
 
 
-def test_validate_tfn_invalid_format():
+def test_validate_tfn_invalid_format(inspector):
     """Test TFN validation with invalid format."""
-    inspector = AustralianPIIInspector()
     assert inspector._validate_tfn("123") is False
     assert inspector._validate_tfn("123456789012") is False
+
+
+def test_validate_checksums(inspector):
+    """Test Medicare and TFN checksum validation."""
+    assert inspector._validate_medicare("2123 456 701") is True
+    assert inspector._validate_medicare("1234 567 890") is False
+    assert inspector._validate_tfn("123456782") is True
+    assert inspector._validate_tfn("123456789") is False
+
+
+def test_detect_pii_tfn_in_non_ascii_digits(inspector):
+    """Test TFNs written in other Unicode digits are checksummed, not dropped."""
+    detections, score = inspector.detect_pii("My TFN is １２３４５６７８２")
+    assert [d.type for d in detections] == ["tfn"]
+    assert score >= 0.3
+
+    assert inspector._validate_tfn("１２３４５６７８９") is False
+
+
+def test_detect_pii_skips_unvalidated_digit_runs(inspector):
+    """Test digit runs failing checksum or lacking postcode context are not reported."""
+    detections, score = inspector.detect_pii("Order 1234 567 890, ref 123456789, in 2024")
+    assert detections == []
+    assert score == 0.0
+
+    detections, _ = inspector.detect_pii("Sydney NSW 2000")
+    assert [d.type for d in detections] == ["postcode"]
+
+    detections, _ = inspector.detect_pii("Postcode: 2000")
+    assert [d.type for d in detections] == ["postcode"]
+
+
+def test_detect_pii_lowercase_state_words_are_not_postcodes(inspector):
+    """Test ordinary words spelling a state abbreviation are not read as addresses."""
+    for text in ("Explain the Privacy Act 1988", "the nt 4000 benchmark", "wa 2024"):
+        assert inspector.detect_pii(text)[0] == []
+
+
+def test_detect_pii_keywords_without_digits(inspector):
+    """Test keyword scoring still applies when the pattern pass is skipped."""
+    detections, score = inspector.detect_pii(
+        "The patient diagnosis and medication are confidential"
+    )
+    assert detections == []
+    assert score >= 0.3
+
+
+def test_detect_pii_shortest_pattern_length(inspector):
+    """Test the length short-circuit still lets the shortest identifier through."""
+    assert inspector.detect_pii("0620")[0] == []
+    assert [d.type for d in inspector.detect_pii("06200")[0]] == ["bsb"]
+
+
+@pytest.mark.parametrize("engine", ["hyperscan", "re2"])
+def test_prefilter_matches_re_only(monkeypatch, engine):
+    """Test the optional Hyperscan and RE2 prefilters do not change detection results."""
+    pytest.importorskip(engine)
+    with monkeypatch.context() as patched:
+        if engine == "re2":
+            patched.setattr("gateway.inspector.hyperscan", None)
+        prefiltered = AustralianPIIInspector()
+        patched.setattr("gateway.inspector.hyperscan", None)
+        patched.setattr("gateway.inspector.re2", None)
+        re_only = AustralianPIIInspector()
+    assert prefiltered.engines["prefilter"] == engine
+    assert re_only.engines["prefilter"] == "none"
+
+    texts = [
+        "My Medicare number is 2123 456 701",
+        "Email jane.doe@example.com.au or call 0412 345 678",
+        "DL: A1234567, account 12345678, BSB 062-000, postcode 2000",
+        "Card 4111 1111 1111 1111 for the patient",
+        "Non-ASCII text with digits: 日本 123456782",
+        "Nothing sensitive here, 42 times over",
+        "call 0412\x0b345\x0b678",
+        "call 0412\x1f345\x1f678",
+        "tfn 123\x1c456\x1c782",
+    ]
+    for text in texts:
+        fast_detections, fast_score = prefiltered.detect_pii(text)
+        detections, score = re_only.detect_pii(text)
+        assert fast_detections == detections
+        assert fast_score == score
+
+
+def test_keyword_automaton_matches_substring_checks(monkeypatch):
+    """Test the optional Aho-Corasick keyword scan counts the same keywords."""
+    pytest.importorskip("ahocorasick")
+    automaton = AustralianPIIInspector()
+    assert automaton._keyword_automaton is not None
+
+    with monkeypatch.context() as patched:
+        patched.setattr("gateway.inspector.ahocorasick", None)
+        substring = AustralianPIIInspector()
+    assert substring._keyword_automaton is None
+
+    texts = [
+        "",
+        "my superannuation and super fund",
+        "patient diagnosis, prescription and medication from the medical record",
+        "tax file number tfn tfn tfn",
+        "nothing to see here",
+    ]
+    for text in texts:
+        assert automaton._calculate_keyword_score(text) == substring._calculate_keyword_score(text)
+
+
+def test_inspectors_share_compiled_patterns():
+    """Test compiled patterns and the keyword automaton are shared across instances."""
+    first, second = AustralianPIIInspector(), AustralianPIIInspector()
+    assert first.patterns is second.patterns
+    assert first.combined_pattern is second.combined_pattern
+    assert first._keyword_automaton is second._keyword_automaton
@@ -2,23 +2,13 @@
 Integration tests for the complete gateway flow.
 """
 
-import os
-import tempfile
-
 import pytest
 
-from gateway.inspector import AustralianPIIInspector
 from gateway.logging_utils import ComplianceLogger
 from gateway.models import GatewayRequest
 from gateway.router import LLMRouter
 
 
-@pytest.fixture
-def inspector():
-    """Create inspector instance."""
-    return AustralianPIIInspector()
-
-
 @pytest.fixture
 def router():
     """Create router instance."""
@@ -26,17 +16,9 @@ def router():
 
 
 @pytest.fixture
-def temp_logger():
-    """Create logger with temp file."""
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".log") as f:
-        temp_path = f.name
-
-    logger = ComplianceLogger(log_file=temp_path)
-    yield logger
-
-    # Cleanup
-    if os.path.exists(temp_path):
-        os.unlink(temp_path)
+def temp_logger(tmp_path):
+    """Create logger with temp file; pytest removes tmp_path afterwards."""
+    return ComplianceLogger(log_file=str(tmp_path / "audit.log"))
 
 
 def test_complete_flow_clean_prompt(inspector, router, temp_logger):
@@ -70,7 +52,7 @@ def test_complete_flow_clean_prompt(inspector, router, temp_logger):
 
 def test_complete_flow_sensitive_prompt(inspector, router, temp_logger):
     """Test complete flow with sensitive prompt."""
-    prompt = "My Medicare number is 1234 567 890 and my TFN is 123456789"
+    prompt = "My Medicare number is 2123 456 701 and my TFN is 123456782"
 
     # Step 1: Detect PII
     pii_detections, pii_score = inspector.detect_pii(prompt)
@@ -109,7 +91,7 @@ def test_gateway_request_model():
 
 def test_pii_detection_redaction(inspector):
     """Test that PII values are properly redacted."""
-    prompt = "My Medicare is 1234567890"
+    prompt = "My Medicare is 2123456701"
     detections, _ = inspector.detect_pii(prompt)
 
     assert len(detections) > 0
@@ -118,4 +100,4 @@ def test_pii_detection_redaction(inspector):
             # Value should be redacted (contains asterisks)
             assert "*" in detection.value
             # Redacted value should not be the original
-            assert detection.value != "1234567890"
+            assert detection.value != "2123456701"
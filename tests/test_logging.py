@@ -2,25 +2,19 @@
 Tests for compliance logging utilities.
 """
 
+import logging.handlers
 import os
-import tempfile
+from datetime import datetime
 
 import pytest
 
-from gateway.logging_utils import ComplianceLogger
+from gateway.logging_utils import ComplianceLogger, _iter_lines_reversed
 
 
 @pytest.fixture
-def temp_log_file():
-    """Create a temporary log file."""
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".log") as f:
-        temp_path = f.name
-
-    yield temp_path
-
-    # Cleanup
-    if os.path.exists(temp_path):
-        os.unlink(temp_path)
+def temp_log_file(tmp_path):
+    """Create a temporary log file path; pytest removes tmp_path afterwards."""
+    return str(tmp_path / "audit.log")
 
 
 def test_compliance_logger_initialization(temp_log_file):
@@ -50,10 +44,8 @@ def test_log_request(temp_log_file):
     # Verify log file was created and has content
     assert os.path.exists(temp_log_file)
 
-    # Force flush and wait for file write
-    import time
-
-    time.sleep(0.5)
+    # Wait for the background listener to write and flush the records
+    logger.flush()
 
     # Read file content
     with open(temp_log_file, "r") as f:
@@ -91,14 +83,74 @@ def test_get_recent_logs(temp_log_file):
     assert all(isinstance(log, dict) for log in logs)
 
 
-def test_get_recent_logs_empty_file():
-    """Test retrieving logs from non-existent file."""
-    import os
-    import tempfile
+def test_get_recent_logs_filters(temp_log_file):
+    """Test route and time filters when retrieving recent logs."""
+    logger = ComplianceLogger(log_file=temp_log_file)
+
+    for i in range(6):
+        logger.log_request(
+            route="cloud" if i % 2 == 0 else "sovereign",
+            pii_score=0.1 * i,
+            pii_types=[],
+            model_used="test_model",
+            prompt_length=100,
+            response_length=500,
+            processing_time_ms=1000.0,
+        )
+
+    # Limit counts JSON entries, not the summary lines written alongside them
+    assert len(logger.get_recent_logs(limit=1)) == 1
 
+    sovereign = logger.get_recent_logs(route="sovereign")
+    assert len(sovereign) == 3
+    assert all(log["route"] == "sovereign" for log in sovereign)
+
+    all_logs = logger.get_recent_logs()
+    cursor = datetime.fromisoformat(all_logs[1]["timestamp"])
+    older = logger.get_recent_logs(before=cursor)
+    newer = logger.get_recent_logs(after=cursor)
+    assert [log["timestamp"] for log in older] == [log["timestamp"] for log in all_logs[2:]]
+    assert [log["timestamp"] for log in newer] == [all_logs[0]["timestamp"]]
+
+    # An offset makes before inclusive, skipping that many entries logged at it
+    at_cursor = logger.get_recent_logs(before=cursor, before_offset=0)
+    assert [log["timestamp"] for log in at_cursor] == [log["timestamp"] for log in all_logs[1:]]
+    assert logger.get_recent_logs(before=cursor, before_offset=1) == at_cursor[1:]
+
+
+def test_write_batch(temp_log_file, capsys):
+    """Test batched writes use the same format and handlers as log_request."""
+    logger = ComplianceLogger(log_file=temp_log_file)
+
+    entries = [
+        logger.build_entry(
+            route="sovereign",
+            pii_score=0.8,
+            pii_types=["medicare"],
+            model_used="llama3 (local)",
+            prompt_length=40,
+            response_length=200,
+            processing_time_ms=120.0 + i,
+        )
+        for i in range(3)
+    ]
+    logger.write_batch(entries)
+
+    with open(temp_log_file, "r") as f:
+        lines = f.read().splitlines()
+    assert len(lines) == 6
+    assert lines[1].startswith("[AUDIT]")
+    assert capsys.readouterr().err.count("[AUDIT]") == 3
+
+    logs = logger.get_recent_logs()
+    assert [log["processing_time_ms"] for log in logs] == [122.0, 121.0, 120.0]
+    assert all(log["sovereignty_enforced"] for log in logs)
+
+
+def test_get_recent_logs_empty_file(tmp_path):
+    """Test retrieving logs from non-existent file."""
     # Use a temp file that doesn't exist yet
-    with tempfile.NamedTemporaryFile(delete=True, suffix=".log") as f:
-        temp_path = f.name
+    temp_path = str(tmp_path / "missing.log")
 
     # File should not exist
     assert not os.path.exists(temp_path)
@@ -106,3 +158,88 @@ def test_get_recent_logs_empty_file():
     logger = ComplianceLogger(log_file=temp_path)
     logs = logger.get_recent_logs()
     assert logs == []
+
+
+def test_log_request_writes_in_background(temp_log_file):
+    """Test log_request only enqueues records and flush waits for the writes."""
+    logger = ComplianceLogger(log_file=temp_log_file)
+    handlers = logger.logger.handlers
+    assert len(handlers) == 1 and isinstance(handlers[0], logging.handlers.QueueHandler)
+
+    logger.log_request(
+        route="cloud",
+        pii_score=0.1,
+        pii_types=[],
+        model_used="gpt-4o",
+        prompt_length=20,
+        response_length=80,
+        processing_time_ms=90.0,
+    )
+    logger.flush()
+
+    with open(temp_log_file, "r") as f:
+        lines = f.read().splitlines()
+    assert len(lines) == 2
+    assert lines[1].startswith("[AUDIT]")
+
+
+def test_iter_lines_reversed_across_chunks(temp_log_file):
+    """Test reading lines backwards gives the same lines whatever the chunk size."""
+    content = b'{"a": 1}\n[AUDIT] summary line\n\n{"b": "longer than one chunk"}\nlast'
+    with open(temp_log_file, "wb") as f:
+        f.write(content)
+
+    expected = list(reversed(content.split(b"\n")))
+    for chunk_size in (1, 3, 7, 8192):
+        assert list(_iter_lines_reversed(temp_log_file, chunk_size)) == expected
+
+
+def test_close_writes_queued_records(temp_log_file):
+    """Test close() drains the queue and flushes the buffered log file."""
+    logger = ComplianceLogger(log_file=temp_log_file)
+    for i in range(3):
+        logger.log_request(
+            route="cloud",
+            pii_score=0.1,
+            pii_types=[],
+            model_used="gpt-4o",
+            prompt_length=20,
+            response_length=80,
+            processing_time_ms=90.0 + i,
+        )
+    logger.close()
+    logger.close()
+
+    with open(temp_log_file, "r") as f:
+        assert len(f.read().splitlines()) == 6
+
+
+def test_logging_after_close_writes_directly(temp_log_file):
+    """Test records logged after close() are written without the background listener."""
+    logger = ComplianceLogger(log_file=temp_log_file)
+    logger.close()
+    logger.log_request(
+        route="sovereign",
+        pii_score=0.9,
+        pii_types=["tfn"],
+        model_used="llama3 (local)",
+        prompt_length=20,
+        response_length=80,
+        processing_time_ms=90.0,
+    )
+    logger.write_batch(
+        [
+            logger.build_entry(
+                route="cloud",
+                pii_score=0.1,
+                pii_types=[],
+                model_used="gpt-4o",
+                prompt_length=20,
+                response_length=80,
+                processing_time_ms=45.0,
+            )
+        ]
+    )
+
+    logs = logger.get_recent_logs()
+    assert [log["route"] for log in logs] == ["cloud", "sovereign"]
@@ -2,6 +2,7 @@
 Tests for data models.
 """
 
+from dataclasses import FrozenInstanceError
 from datetime import datetime
 
 import pytest
@@ -45,7 +46,7 @@ def test_pii_detection_confidence_validation():
     assert detection.confidence == 0.5
 
     # Invalid confidence (too high)
-    with pytest.raises(Exception):  # Pydantic validation error
+    with pytest.raises(ValueError):
         PIIDetection(type="tfn", value="123****", confidence=1.5)
 
     # Invalid confidence (negative)
@@ -92,3 +93,28 @@ def test_audit_log_entry_valid():
     assert entry.pii_score == 0.85
     assert len(entry.pii_types) == 2
     assert isinstance(entry.timestamp, datetime)
+
+
+def test_audit_log_entry_route_validation():
+    """Test AuditLogEntry rejects unknown routes."""
+    with pytest.raises(ValueError):
+        AuditLogEntry(
+            route="offshore",
+            pii_score=0.1,
+            pii_types=[],
+            model_used="gpt-4o",
+            prompt_length=10,
+            response_length=20,
+            processing_time_ms=5.0,
+        )
+
+
+def test_gateway_models_are_frozen():
+    """Test request, response and detection models reject attribute assignment."""
+    request = GatewayRequest(prompt="Test")
+    with pytest.raises(Exception):
+        request.prompt = "Changed"
+
+    detection = PIIDetection(type="tfn", value="123****", confidence=0.95)
+    with pytest.raises(FrozenInstanceError):
+        detection.value = "123456782"
@@ -2,7 +2,11 @@
 Tests for routing logic.
 """
 
-from unittest.mock import patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import requests
 
 from gateway.models import PIIDetection
 from gateway.router import LLMRouter
@@ -31,8 +35,8 @@ def test_routing_decision_sensitive():
     router = LLMRouter()
     router.pii_threshold = 0.3
 
-    prompt = "My Medicare number is 1234 567 890"
-    detections = [PIIDetection(type="medicare", value="1234***890", confidence=0.95)]
+    prompt = "My Medicare number is 2123 456 701"
+    detections = [PIIDetection(type="medicare", value="2123***701", confidence=0.95)]
     pii_score = 0.8
 
     # Mock the API calls
@@ -67,3 +71,62 @@ def test_pii_threshold():
         with patch.object(router, "_call_ollama", return_value="Local response"):
             _, route, _ = router.route_and_infer(prompt, detections, pii_score)
             assert route == "sovereign"
+
+
+def test_routing_decision_async():
+    """Test that the async routing path makes the same decisions."""
+    router = LLMRouter()
+    router.pii_threshold = 0.3
+
+    detections = [PIIDetection(type="medicare", value="2123***701", confidence=0.95)]
+
+    with patch.object(router, "_call_openai_async", AsyncMock(return_value="Canberra")):
+        with patch.object(router, "_call_ollama_async", AsyncMock(return_value="Local response")):
+            response, route, _ = asyncio.run(
+                router.route_and_infer_async("What is the capital of Australia?", [], 0.1)
+            )
+            assert route == "cloud"
+            assert response == "Canberra"
+
+            response, route, _ = asyncio.run(
+                router.route_and_infer_async("My Medicare number is 2123 456 701", detections, 0.8)
+            )
+            assert route == "sovereign"
+            assert response == "Local response"
+
+
+def test_router_uses_injected_client():
+    """Test that a provided HTTP client is shared instead of creating one."""
+    client = httpx.AsyncClient()
+    router = LLMRouter(client=client)
+    assert router.client is client
+    asyncio.run(client.aclose())
+
+
+def test_router_uses_injected_session():
+    """Test that blocking calls go through the shared requests session."""
+    session = MagicMock()
+    session.post.return_value.status_code = 200
+    session.post.return_value.json.return_value = {"response": "Local response"}
+
+    router = LLMRouter(session=session)
+    assert router._call_ollama("Hello") == "Local response"
+    session.post.assert_called_once()
+
+
+def test_upstream_errors_match_across_transports():
+    """Test blocking and async calls report upstream failures with the same message."""
+    session = MagicMock()
+    client = MagicMock()
+    router = LLMRouter(client=client, session=session)
+
+    failures = [
+        (requests.exceptions.ConnectionError("refused"), httpx.ConnectError("refused")),
+        (requests.exceptions.ReadTimeout("slow"), httpx.ReadTimeout("slow")),
+    ]
+    for blocking_error, async_error in failures:
+        session.post.side_effect = blocking_error
+        client.post = AsyncMock(side_effect=async_error)
+        response = router._call_ollama("Hello")
+        assert response.startswith("[ERROR]")
+        assert asyncio.run(router._call_ollama_async("Hello")) == response